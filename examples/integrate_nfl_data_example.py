@@ -7,16 +7,23 @@ This shows exactly how to integrate NFL data enhancement into your
 existing sleeper_cheatsheet.py without breaking anything.
 """
 
-import pandas as pd
-import sys
-import os
-from pathlib import Path
+from functools import lru_cache
+from typing import FrozenSet, Optional
 
-# Add scripts to path
-sys.path.append(str(Path(__file__).parent / "scripts"))
+import numpy as np
+import pandas as pd
 
 from core.enhanced_fantasy_tool import EnhancedFantasyTool
 
+# Candidate names for the player column, in order of preference
+PLAYER_COL_CANDIDATES = ("player", "Player", "PLAYER", "name", "Name")
+
+
+@lru_cache(maxsize=32)
+def _find_player_col(columns: FrozenSet[str]) -> Optional[str]:
+    """Return the first player column candidate present in ``columns``"""
+    return next((c for c in PLAYER_COL_CANDIDATES if c in columns), None)
+
 
 def integrate_nfl_data_with_existing_tool():
     """
@@ -27,7 +34,12 @@ def integrate_nfl_data_with_existing_tool():
 
     # Step 1: Load your existing fantasy projections
     # (This is what you already do in your main script)
-    fantasy_projections = pd.read_csv("data/offense_projections.csv")
+    fantasy_projections = pd.read_csv(
+        "data/offense_projections.csv",
+        engine="pyarrow",
+        dtype={"Player": "string", "Pos": "category", "Team": "category"},
+        na_values=["\xa0"],
+    ).dropna(subset=["Player"])
     print(f"📋 Loaded {len(fantasy_projections)} fantasy projections")
 
     # Step 2: Initialize the NFL enhancement tool
@@ -50,11 +62,7 @@ def integrate_nfl_data_with_existing_tool():
     # Show sample of enhanced data
     if not enhanced_projections.empty:
         # Handle different possible column names
-        player_col = None
-        for col in ["player", "Player", "PLAYER", "name", "Name"]:
-            if col in enhanced_projections.columns:
-                player_col = col
-                break
+        player_col = _find_player_col(frozenset(enhanced_projections.columns))
 
         if player_col:
             sample_cols = [
@@ -96,33 +104,23 @@ def show_nfl_insights(enhanced_projections):
         print("❌ No NFL data available for insights")
         return
 
+    player_col = _find_player_col(frozenset(enhanced_projections.columns))
+
     print("\n🎯 NFL Data Insights:")
 
     # Top performers by NFL PPR
-    if "nfl_avg_ppr" in enhanced_projections.columns:
-        # Find player column name
-        player_col = None
-        for col in ["player", "Player", "PLAYER", "name", "Name"]:
-            if col in enhanced_projections.columns:
-                player_col = col
-                break
-
-        if player_col:
-            top_nfl_performers = enhanced_projections.nlargest(5, "nfl_avg_ppr")
-            print("\n🔥 Top NFL Performers (by average PPR):")
-            for _, row in top_nfl_performers.iterrows():
-                player_name = row[player_col]
-                ppr = row.get("nfl_avg_ppr", 0)
-                games = row.get("nfl_games_played", 0)
-                print(f"  • {player_name}: {ppr:.1f} PPR ({games} games)")
-        else:
-            print("\n🔥 Top NFL Performers (by average PPR):")
-            top_nfl_performers = enhanced_projections.nlargest(5, "nfl_avg_ppr")
-            print(
-                top_nfl_performers[["nfl_avg_ppr", "nfl_games_played"]].to_string(
-                    index=False
-                )
-            )
+    top_nfl_performers = enhanced_projections.nlargest(5, "nfl_avg_ppr")
+    top_cols = [
+        col
+        for col in (player_col, "nfl_avg_ppr", "nfl_games_played")
+        if col in enhanced_projections.columns
+    ]
+    print("\n🔥 Top NFL Performers (by average PPR):")
+    print(
+        top_nfl_performers[top_cols].to_string(
+            index=False, formatters={"nfl_avg_ppr": "{:.1f}".format}
+        )
+    )
 
     # Trending players
     if "nfl_trend" in enhanced_projections.columns:
@@ -130,38 +128,34 @@ def show_nfl_insights(enhanced_projections):
             enhanced_projections["nfl_trend"] == "Improving"
         ]
         if not improving.empty:
+            improving_cols = [
+                col
+                for col in (player_col, "nfl_team", "nfl_games_played")
+                if col in enhanced_projections.columns
+            ]
             print("\n🚀 Improving Players:")
-            for _, row in improving.head(3).iterrows():
-                player_name = (
-                    row.get(player_col, "Unknown Player")
-                    if player_col
-                    else "Unknown Player"
-                )
-                team = row.get("nfl_team", "Unknown")
-                games = row.get("nfl_games_played", 0)
-                print(f"  • {player_name} ({team}) - {games} games")
+            print(improving.head(3)[improving_cols].to_string(index=False))
 
     # Value opportunities (high NFL PPR, reasonable ADP)
-    if (
-        "adp" in enhanced_projections.columns
-        and "nfl_avg_ppr" in enhanced_projections.columns
-    ):
-        value_picks = enhanced_projections[
-            (enhanced_projections["nfl_avg_ppr"] > 15)
-            & (enhanced_projections["adp"] > 30)
-            & (enhanced_projections["nfl_games_played"] >= 10)
-        ]
+    if {"adp", "nfl_games_played"}.issubset(enhanced_projections.columns):
+        value_mask = (
+            (enhanced_projections["nfl_avg_ppr"].to_numpy() > 15)
+            & (enhanced_projections["adp"].to_numpy() > 30)
+            & (enhanced_projections["nfl_games_played"].to_numpy() >= 10)
+        )
+        value_picks = enhanced_projections.iloc[np.flatnonzero(value_mask)[:3]]
         if not value_picks.empty:
+            value_cols = [
+                col
+                for col in (player_col, "nfl_avg_ppr", "adp")
+                if col in enhanced_projections.columns
+            ]
             print("\n💎 Potential Value Picks:")
-            for _, row in value_picks.head(3).iterrows():
-                player_name = (
-                    row.get(player_col, "Unknown Player")
-                    if player_col
-                    else "Unknown Player"
+            print(
+                value_picks[value_cols].to_string(
+                    index=False, formatters={"nfl_avg_ppr": "{:.1f}".format}
                 )
-                ppr = row.get("nfl_avg_ppr", 0)
-                adp = row.get("adp", 0)
-                print(f"  • {player_name}: {ppr:.1f} PPR (ADP: {adp})")
+            )
 
 
 if __name__ == "__main__":
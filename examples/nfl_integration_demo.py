@@ -7,17 +7,26 @@ This script demonstrates how to integrate NFL data with your existing
 fantasy drafting tool for enhanced projections and analysis.
 """
 
-import pandas as pd
-import sys
-import os
-from pathlib import Path
+import types
 
-# Add the scripts directory to the path
-sys.path.append(str(Path(__file__).parent / "scripts"))
+import numpy as np
+import pandas as pd
 
 from core.enhanced_fantasy_tool import EnhancedFantasyTool
 from core.nfl_data_integration import NFLDataIntegrator
 
+# Offensive positions shown in the demo and the stat each is ranked by
+POSITIONS = ("QB", "RB", "WR", "TE")
+METRICS = types.MappingProxyType(
+    {
+        "QB": "passing_yards",
+        "RB": "rushing_yards",
+        "WR": "receiving_yards",
+        "TE": "receiving_yards",
+    }
+)
+GROUP_COLS = ["position", "player_display_name"]
+
 
 def demo_nfl_integration():
     """Demonstrate NFL data integration capabilities"""
@@ -28,7 +37,10 @@ def demo_nfl_integration():
     try:
         # Initialize the enhanced tool
         enhanced_tool = EnhancedFantasyTool()
-        nfl_integrator = NFLDataIntegrator()
+        # Reuse the tool's own integrator rather than warming up a second one
+        nfl_integrator = (
+            getattr(enhanced_tool, "integrator", None) or NFLDataIntegrator()
+        )
 
         print("\n📊 Fetching NFL Data...")
 
@@ -80,25 +92,30 @@ def show_top_performers(advanced_data: pd.DataFrame):
 
     print("\n🔥 Top Performers by Position (2024)")
 
-    positions = ["QB", "RB", "WR", "TE"]
-    metrics = {
-        "QB": "passing_yards",
-        "RB": "rushing_yards",
-        "WR": "receiving_yards",
-        "TE": "receiving_yards",
-    }
+    # Pick each row's position metric, then rank every position in one groupby
+    pos_data = advanced_data[advanced_data["position"].isin(POSITIONS)]
+    metric_value = np.select(
+        [pos_data["position"] == pos for pos in METRICS],
+        [pos_data[metric] for metric in METRICS.values()],
+        default=0.0,
+    )
+    top_players = (
+        pos_data.assign(metric_value=metric_value)
+        .groupby(GROUP_COLS, observed=True)["metric_value"]
+        .sum()
+        .groupby(level="position", group_keys=False, observed=True)
+        .nlargest(3)
+    )
 
-    for position in positions:
-        pos_data = advanced_data[advanced_data["position"] == position]
-        if not pos_data.empty:
-            metric = metrics[position]
-            top_players = (
-                pos_data.groupby("player_display_name")[metric].sum().nlargest(3)
-            )
+    for position in POSITIONS:
+        if position not in top_players.index.get_level_values("position"):
+            continue
 
-            print(f"\n{position} - Top by {metric.replace('_', ' ').title()}:")
-            for i, (name, value) in enumerate(top_players.items(), 1):
-                print("2d")
+        metric = METRICS[position]
+        print(f"\n{position} - Top by {metric.replace('_', ' ').title()}:")
+        leaders = top_players.xs(position, level="position")
+        for i, (name, value) in enumerate(leaders.items(), 1):
+            print(f"  {i:2d}. {name}: {value:,.0f}")
 
 
 def show_position_analysis(nfl_integrator: NFLDataIntegrator):
@@ -106,7 +123,7 @@ def show_position_analysis(nfl_integrator: NFLDataIntegrator):
 
     print("\n📊 Position Analysis (2024)")
 
-    for position in ["QB", "RB", "WR", "TE"]:
+    for position in POSITIONS:
         pos_stats = nfl_integrator.get_position_stats(position, [2024])
 
         if not pos_stats.empty:
@@ -4,15 +4,18 @@ Quick test of NFL data enhancement
 """
 
 import pandas as pd
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent / "scripts"))
 from core.enhanced_fantasy_tool import EnhancedFantasyTool
 
-# Load fantasy projections and filter out empty rows
-fantasy = pd.read_csv("data/offense_projections.csv")
-fantasy = fantasy[fantasy["Player"].notna() & (fantasy["Player"] != "\xa0")]
+# Load only the columns this test needs; blank "\xa0" rows are read as NA
+fantasy = pd.read_csv(
+    "data/offense_projections.csv",
+    engine="pyarrow",
+    usecols=["Player", "Team", "Pos", "FPTS"],
+    dtype={"Player": "string", "Pos": "category", "Team": "category"},
+    na_values=["\xa0"],
+)
+fantasy = fantasy.dropna(subset=["Player"])
 print(f"Loaded {len(fantasy)} valid fantasy players")
 
 # Test with just a few players
@@ -1,36 +1,48 @@
 #!/usr/bin/env python3
 """
-Simple script to run Flask app using flask run command
+Simple script to run the Flask app in-process (no flask CLI subprocess)
 """
 
 import os
 import sys
-import subprocess
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
 
 
 def run_flask_app():
-    """Run the Flask app using flask run"""
+    """Import the Flask app and serve it from this interpreter"""
     print("🏈 Fantasy Drafting Web Dashboard")
     print("=" * 40)
-    print("🚀 Starting dashboard with Flask CLI...")
+    print("🚀 Starting dashboard...")
     print("📊 Dashboard will be available at: http://localhost:5000")
     print("🛑 Press Ctrl+C to stop the server")
     print()
 
-    # Change to src/web directory where the Flask app is located
+    # The Flask app lives in src/web at the project root and resolves its
+    # config with paths relative to that directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    web_dashboard_dir = os.path.join(script_dir, "src", "web")
+    web_dashboard_dir = os.path.join(script_dir, "..", "..", "src", "web")
+    os.chdir(web_dashboard_dir)
+    sys.path.insert(0, os.path.abspath(web_dashboard_dir))
+
+    try:
+        from app import app
+    except ImportError as e:
+        print(f"❌ Could not import the Flask app: {e}")
+        print("   pip install flask flask-cors")
+        return
 
     try:
-        # Run flask command
-        subprocess.run(["flask", "run"], cwd=web_dashboard_dir, check=True)
+        if serve is not None:
+            # Multi-threaded WSGI server when waitress is installed
+            serve(app, host="0.0.0.0", port=5000, threads=8)
+        else:
+            app.run(host="0.0.0.0", port=5000, threaded=True)
     except KeyboardInterrupt:
         print("\n👋 Dashboard stopped")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running Flask: {e}")
-    except FileNotFoundError:
-        print("❌ Flask not found. Make sure Flask is installed:")
-        print("   pip install flask")
 
 
 if __name__ == "__main__":
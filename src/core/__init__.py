@@ -0,0 +1 @@
+"""Core fantasy draft tooling: cheat sheet builder, API integrations and analyzers."""
@@ -9,16 +9,88 @@ to enhance the drafting experience with live data, advanced analytics, and real-
 
 import requests
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # fall back to the stdlib parser used by requests
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns kept from nfl-data-py pulls - downstream analysis only touches these
+WEEKLY_COLS = [
+    "player_id",
+    "player_display_name",
+    "position",
+    "recent_team",
+    "week",
+    "season",
+    "season_type",
+    "fantasy_points_ppr",
+    "attempts",
+    "passing_yards",
+    "rushing_yards",
+    "receiving_yards",
+    "receptions",
+    "targets",
+    "carries",
+]
+
+SEASONAL_COLS = [
+    "player_id",
+    "season",
+    "season_type",
+    "games",
+    "fantasy_points_ppr",
+    "attempts",
+    "passing_yards",
+    "passing_tds",
+    "rushing_yards",
+    "rushing_tds",
+    "carries",
+    "receiving_yards",
+    "receiving_tds",
+    "receptions",
+    "targets",
+    "tgt_sh",
+    "wopr_x",
+    "dom",
+]
+
+ROSTER_COLS = [
+    "player_id",
+    "player_name",
+    "position",
+    "team",
+    "season",
+    "status",
+    "age",
+    "years_exp",
+    "sleeper_id",
+]
+
+# Low-cardinality string columns stored as categoricals
+CATEGORY_COLS = (
+    "position",
+    "recent_team",
+    "team",
+    "player_display_name",
+    "season_type",
+    "status",
+)
+
 
 class FantasyDataAPI:
     """Base class for fantasy football API integrations"""
@@ -27,17 +99,30 @@ class FantasyDataAPI:
         self.session = requests.Session()
         self.session.headers.update(
             {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept-Encoding": "gzip",
             }
         )
 
+        # Reuse connections across calls and retry transient server errors
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def get_data(self, endpoint: str, params: Dict = None) -> Dict:
         """Generic method to fetch data from API"""
         try:
             response = self.session.get(endpoint, params=params, timeout=30)
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content) if response.content else {}
             return response.json()
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"API request failed: {e}")
             return {}
 
@@ -63,27 +148,178 @@ class ESPNAPI(FantasyDataAPI):
 
 
 class NFLDataAPI(FantasyDataAPI):
-    """NFL Data API Integration using nfl-data-py"""
+    """NFL Data API Integration using nfl-data-py
+
+    Pulls are cached on disk as parquet files keyed by dataset and season, so
+    repeated runs read the local copy instead of re-downloading the season.
+    Within a session the most recently loaded season of each dataset is also
+    kept in memory, subject to the same max_age; callers get their own copy.
+    """
+
+    def __init__(self, cache_dir: str = ".nfl_cache", max_age: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory holding cached parquet files
+            max_age: Seconds before a cached file is considered stale (None = never)
+        """
+        super().__init__()
+        self._cache_path = Path(cache_dir)
+        self.max_age = max_age
+        # dataset -> (season, loaded/cached at, frame); one season per dataset so
+        # walking several seasons doesn't keep all of them alive
+        self._memory: Dict[str, tuple] = {}
+
+    def _cache_file(self, dataset: str, season: int) -> Path:
+        """Parquet path for a cached dataset/season pull"""
+        return self._cache_path / f"{dataset}_{season}.parquet"
+
+    @staticmethod
+    def _select_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Keep only the whitelisted columns that are present in the frame"""
+        return df[[c for c in columns if c in df.columns]]
+
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink dtypes: categorical names/teams, float32 stats, small ints"""
+        df = df.copy()
+        for col in CATEGORY_COLS:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
+        for col in df.select_dtypes(include="float").columns:
+            df[col] = pd.to_numeric(df[col], downcast="float")
+
+        for col in df.select_dtypes(include="int64").columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+
+        for col, dtype in (("week", "int8"), ("season", "int16")):
+            if col in df.columns and df[col].notna().all():
+                df[col] = df[col].astype(dtype)
+
+        return df
+
+    def _is_fresh(self, stamp: float) -> bool:
+        """Whether data written/loaded at ``stamp`` is within max_age"""
+        return self.max_age is None or time.time() - stamp <= self.max_age
+
+    def _read_cache(self, path: Path) -> Optional[pd.DataFrame]:
+        """Return the cached frame if present and fresh, otherwise None"""
+        if not path.exists():
+            return None
+        if not self._is_fresh(path.stat().st_mtime):
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Could not read NFL cache {path}: {e}")
+            return None
 
-    def get_weekly_data(self, season: int = 2024) -> pd.DataFrame:
-        """Fetch weekly NFL data"""
+    def _write_cache(self, path: Path, df: pd.DataFrame):
+        """Persist a pulled frame to the parquet cache"""
         try:
-            import nfl_data_py as nfl
+            self._cache_path.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(path, compression="zstd")
+        except Exception as e:
+            logger.warning(f"Could not write NFL cache {path}: {e}")
+
+    def _load(
+        self, dataset: str, season: int, loader: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Load a dataset from the cache, falling back to nfl-data-py"""
+        remembered = self._memory.get(dataset)
+        if remembered is not None:
+            remembered_season, stamp, frame = remembered
+            if remembered_season == season and self._is_fresh(stamp):
+                return frame.copy()
+
+        path = self._cache_file(dataset, season)
+        cached = self._read_cache(path)
+        if cached is not None:
+            self._memory[dataset] = (season, path.stat().st_mtime, cached)
+            return cached.copy()
 
-            return nfl.import_weekly_data([season])
+        try:
+            df = loader()
         except ImportError:
             logger.warning("nfl-data-py not installed")
             return pd.DataFrame()
 
+        if not df.empty:
+            df = self._downcast(df)
+            self._write_cache(path, df)
+            self._memory[dataset] = (season, time.time(), df)
+            return df.copy()
+        return df
+
+    def get_weekly_data(
+        self, season: int = 2024, players: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch weekly NFL data.
+
+        Args:
+            season: Season to fetch
+            players: Optional player names to keep (case-insensitive). Filtering
+                here keeps later joins against small projection frames cheap.
+        """
+
+        def loader():
+            import nfl_data_py as nfl
+
+            return self._select_columns(nfl.import_weekly_data([season]), WEEKLY_COLS)
+
+        df = self._load("weekly", season, loader)
+        if players is not None and "player_display_name" in df.columns:
+            wanted = {str(p).lower() for p in players}
+            df = df[df["player_display_name"].str.lower().isin(wanted)]
+        return df
+
+    def get_seasonal_data(self, season: int = 2024) -> pd.DataFrame:
+        """Fetch seasonal NFL data"""
+
+        def loader():
+            import nfl_data_py as nfl
+
+            return self._select_columns(
+                nfl.import_seasonal_data([season]), SEASONAL_COLS
+            )
+
+        return self._load("seasonal", season, loader)
+
     def get_roster_data(self, season: int = 2024) -> pd.DataFrame:
         """Fetch roster information"""
-        try:
+
+        def loader():
             import nfl_data_py as nfl
 
-            return nfl.import_rosters([season])
-        except ImportError:
-            logger.warning("nfl-data-py not installed")
-            return pd.DataFrame()
+            return self._select_columns(nfl.import_rosters([season]), ROSTER_COLS)
+
+        return self._load("roster", season, loader)
+
+    def clear_cache(self, dataset: Optional[str] = None) -> int:
+        """
+        Remove cached parquet files and their in-memory copies.
+
+        Args:
+            dataset: Only clear this dataset ('weekly', 'seasonal', 'roster');
+                clears everything when None
+
+        Returns:
+            Number of files removed
+        """
+        if dataset is None:
+            self._memory.clear()
+        else:
+            self._memory.pop(dataset, None)
+        if not self._cache_path.exists():
+            return 0
+
+        pattern = f"{dataset}_*.parquet" if dataset else "*.parquet"
+        removed = 0
+        for path in self._cache_path.glob(pattern):
+            path.unlink()
+            removed += 1
+        return removed
 
 
 class FantasyProsAPI(FantasyDataAPI):
@@ -124,6 +360,12 @@ class WeatherAPI(FantasyDataAPI):
         params = {"q": city, "appid": self.api_key, "units": "imperial"}
         return self.get_data(endpoint, params)
 
+    def get_games_weather(self, cities: List[str]) -> Dict[str, Dict]:
+        """Get weather for several game locations concurrently, keyed by city"""
+        from core.weather_analyzer import fetch_weather_by_city
+
+        return fetch_weather_by_city(self.get_game_weather, cities)
+
 
 class EnhancedDraftTool:
     """Enhanced draft tool with API integrations"""
@@ -136,23 +378,29 @@ class EnhancedDraftTool:
 
     def get_live_adp(self) -> pd.DataFrame:
         """Fetch live ADP from multiple sources"""
-        sources = []
-
-        # Sleeper ADP (existing)
-        try:
-            sleeper_data = self._get_sleeper_adp()
-            if not sleeper_data.empty:
-                sources.append(sleeper_data)
-        except Exception as e:
-            logger.warning(f"Sleeper ADP failed: {e}")
-
-        # ESPN ADP
-        try:
-            espn_data = self._get_espn_adp()
-            if not espn_data.empty:
-                sources.append(espn_data)
-        except Exception as e:
-            logger.warning(f"ESPN ADP failed: {e}")
+        fetchers = {
+            "Sleeper": self._get_sleeper_adp,
+            "ESPN": self._get_espn_adp,
+        }
+
+        # Sources are network-bound, so fetch them concurrently
+        results = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {executor.submit(fn): name for name, fn in fetchers.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    data = future.result()
+                    if not data.empty:
+                        results[name] = data
+                except Exception as e:
+                    logger.warning(f"{name} ADP failed: {e}")
+
+        # Keep source order stable regardless of completion order, tagging
+        # each frame so the consensus can report where a player's ADP came from
+        sources = [
+            results[name].assign(source=name) for name in fetchers if name in results
+        ]
 
         # Combine sources
         if sources:
@@ -163,6 +411,11 @@ class EnhancedDraftTool:
         """Get ADP from Sleeper API"""
         url = "https://api.sleeper.app/v1/adp/players/2025?season_type=regular&scoring=ppr"
         data = self.espn_api.get_data(url)
+        # Flat record lists skip the (much slower) json_normalize path
+        if isinstance(data, list) and not any(
+            isinstance(value, dict) for record in data[:1] for value in record.values()
+        ):
+            return pd.DataFrame.from_records(data)
         return pd.json_normalize(data)
 
     def _get_espn_adp(self) -> pd.DataFrame:
@@ -172,8 +425,19 @@ class EnhancedDraftTool:
 
     def _consensus_adp(self, sources: List[pd.DataFrame]) -> pd.DataFrame:
         """Create consensus ADP from multiple sources"""
-        # Implementation for combining ADP sources
-        return sources[0] if sources else pd.DataFrame()
+        if not sources:
+            return pd.DataFrame()
+
+        # Concatenate once instead of growing a frame source by source
+        combined = pd.concat(sources, ignore_index=True)
+        if not {"player_id", "adp"}.issubset(combined.columns):
+            logger.warning("ADP sources lack player_id/adp columns; using first source")
+            return sources[0]
+
+        agg = {"adp": "mean"}
+        if "source" in combined.columns:
+            agg["source"] = lambda s: ",".join(s.astype(str).unique())
+        return combined.groupby("player_id", as_index=False, sort=False).agg(agg)
 
     def get_injury_impact(self) -> pd.DataFrame:
         """Analyze injury impact on player values"""
@@ -192,9 +456,15 @@ class EnhancedDraftTool:
         pass
 
 
+@lru_cache(maxsize=1)
+def get_draft_tool() -> EnhancedDraftTool:
+    """Return a shared EnhancedDraftTool so sessions and caches are built once"""
+    return EnhancedDraftTool()
+
+
 if __name__ == "__main__":
     # Example usage
-    tool = EnhancedDraftTool()
+    tool = get_draft_tool()
 
     # Test API connections
     print("Testing API connections...")
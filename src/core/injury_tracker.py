@@ -52,7 +52,13 @@ class InjuryTracker:
                     }
                 )
 
-            return pd.DataFrame(injuries)
+            # Teams, positions and statuses repeat heavily; categories keep the
+            # later merge/groupby work on integer codes
+            injuries_df = pd.DataFrame(injuries)
+            for col in ("team", "position", "injury_status", "injury_type"):
+                if col in injuries_df.columns:
+                    injuries_df[col] = injuries_df[col].astype("category")
+            return injuries_df
 
         except requests.RequestException as e:
             print(f"ESPN injury API error: {e}")
@@ -86,35 +92,32 @@ class InjuryTracker:
             how="left",
         )
 
-        # Apply injury adjustments
-        for idx, row in merged_df.iterrows():
-            status = row.get("injury_status", "Healthy")
-
-            if pd.isna(status):
-                status = "Healthy"
-
-            impact_multiplier = status_impact.get(status, 1.0)
-
-            # Apply to relevant projection columns
-            projection_cols = [
-                "pass_yd",
-                "pass_td",
-                "rush_yd",
-                "rush_td",
-                "rec_yd",
-                "rec_td",
-                "rec",
-                "fumbles_lost",
-            ]
-
-            for col in projection_cols:
-                if col in merged_df.columns and not pd.isna(row.get(col)):
-                    original_value = row[col]
-                    adjusted_value = original_value * impact_multiplier
-                    merged_df.at[idx, f"{col}_adjusted"] = adjusted_value
-                    merged_df.at[idx, f"{col}_injury_impact"] = (
-                        original_value - adjusted_value
-                    )
+        # Apply injury adjustments column-wise; unknown or missing statuses are
+        # treated as healthy
+        if "injury_status" in merged_df.columns:
+            impact_multiplier = (
+                merged_df["injury_status"].map(status_impact).astype(float).fillna(1.0)
+            )
+        else:
+            impact_multiplier = pd.Series(1.0, index=merged_df.index)
+
+        # Apply to relevant projection columns
+        projection_cols = [
+            "pass_yd",
+            "pass_td",
+            "rush_yd",
+            "rush_td",
+            "rec_yd",
+            "rec_td",
+            "rec",
+            "fumbles_lost",
+        ]
+
+        for col in projection_cols:
+            if col in merged_df.columns:
+                adjusted_values = merged_df[col] * impact_multiplier
+                merged_df[f"{col}_adjusted"] = adjusted_values
+                merged_df[f"{col}_injury_impact"] = merged_df[col] - adjusted_values
 
         return merged_df
 
@@ -137,7 +140,7 @@ class InjuryTracker:
 
         # Group by team and position
         trends = (
-            recent_injuries.groupby(["team", "position"])
+            recent_injuries.groupby(["team", "position"], observed=True)
             .agg(
                 {"player_name": "count", "injury_status": lambda x: (x == "Out").sum()}
             )
@@ -38,17 +38,19 @@ Endpoints and formats can change—CSV import is the most reliable approach.
 
 from __future__ import annotations
 
+import copy
 import json
 import os
-from typing import Dict, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 
-# Excel formatting
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Font, PatternFill
-from openpyxl.formatting.rule import FormulaRule
+# Excel formatting (openpyxl) is imported inside the functions that style the
+# workbook, so importing the name/position helpers from here stays lightweight
 
 # =============================================================================
 # CONFIGURATION - Set your desired config file and profile here
@@ -71,12 +73,35 @@ try:
 except Exception:
     requests = None  # in case user doesn't need API fetch
 
+try:
+    from fastnumbers import try_float
+except ImportError:
+    try_float = None  # clean_numeric falls back to float() parsing
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None  # player alignment sticks to exact name matches
+
 
 # -------------------------------
 # 1) CONFIG LOADING
 # -------------------------------
 
 
+@lru_cache(maxsize=32)
+def _read_configs(path: str, mtime: float) -> dict:
+    """Parse a config file; cached per (path, mtime) so edits are picked up."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _load_configs(config_file: str) -> dict:
+    """Return the parsed contents of a config file, reusing earlier parses."""
+    path = os.path.abspath(config_file)
+    return _read_configs(path, os.path.getmtime(path))
+
+
 def load_config(config_file: str = "config.json", config_name: str = "default") -> dict:
     """
     Load configuration from JSON file.
@@ -91,8 +116,7 @@ def load_config(config_file: str = "config.json", config_name: str = "default")
     if not os.path.exists(config_file):
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
 
-    with open(config_file, "r") as f:
-        configs = json.load(f)
+    configs = _load_configs(config_file)
 
     if config_name not in configs:
         available = list(configs.keys())
@@ -100,7 +124,8 @@ def load_config(config_file: str = "config.json", config_name: str = "default")
             f"Configuration '{config_name}' not found. Available: {available}"
         )
 
-    return configs[config_name]
+    # Callers may adjust their config, so hand out a copy of the cached one
+    return copy.deepcopy(configs[config_name])
 
 
 def get_available_configs(config_file: str = "config.json") -> list:
@@ -108,10 +133,7 @@ def get_available_configs(config_file: str = "config.json") -> list:
     if not os.path.exists(config_file):
         return []
 
-    with open(config_file, "r") as f:
-        configs = json.load(f)
-
-    return list(configs.keys())
+    return list(_load_configs(config_file))
 
 
 def list_all_available_configs():
@@ -128,15 +150,14 @@ def list_all_available_configs():
     print("=" * 50)
 
     for config_file in config_files:
-        if os.path.exists(config_file):
-            configs = get_available_configs(config_file)
-            if configs:
-                print(f"\n{config_file}:")
-                for config_name in configs:
-                    print(f"  - {config_name}")
-                    print(
-                        f'    Usage: CONFIG_FILE, CONFIG_PROFILE = "{config_file}", "{config_name}"'
-                    )
+        configs = get_available_configs(config_file)
+        if configs:
+            print(f"\n{config_file}:")
+            for config_name in configs:
+                print(f"  - {config_name}")
+                print(
+                    f'    Usage: CONFIG_FILE, CONFIG_PROFILE = "{config_file}", "{config_name}"'
+                )
     print("\n" + "=" * 50)
     print(
         "💡 Copy one of the usage lines above to the CONFIG section at the top of this script."
@@ -147,84 +168,121 @@ def list_all_available_configs():
 # 2) COLUMN MAPPINGS
 # -------------------------------
 
+
+def _build_alias_index(mapping: Dict[str, Sequence[str]]) -> Dict[str, tuple]:
+    """Reverse a column mapping into header alias -> (canonical key, preference)."""
+    index = {}
+    for canonical, aliases in mapping.items():
+        for preference, alias in enumerate(aliases):
+            index.setdefault(alias, (canonical, preference))
+    return index
+
+
 # Flexible projections columns (rename if needed)
 OFFENSE_MAP = {
-    "player": [
+    "player": (
         "player",
         "player_name",
         "name",
         "display_name",
         "PLAYER NAME",
         "Player",
-    ],
-    "position": ["position", "pos", "POS", "Pos"],
-    "team": ["team", "team_abbr", "team_code", "nfl_team", "TEAM", "Team"],
-    "age": ["age"],
-    "rank": ["RK", "rank", "overall_rank"],
-    "tier": ["TIERS", "tier"],
+    ),
+    "position": ("position", "pos", "POS", "Pos"),
+    "team": ("team", "team_abbr", "team_code", "nfl_team", "TEAM", "Team"),
+    "age": ("age",),
+    "rank": ("RK", "rank", "overall_rank"),
+    "tier": ("TIERS", "tier"),
     # passing
-    "pass_yards": ["pass_yards", "pass_yd", "pass_yds", "py", "YDS"],
-    "pass_td": ["pass_td", "pass_tds", "TDS"],
-    "pass_int": ["pass_int", "ints", "INTS"],
-    "pass_2pt": ["pass_2pt", "pass_two_pt"],
-    "pass_comp_25p_events": ["pass_comp_25p_events"],  # optional expected counts
+    "pass_yards": ("pass_yards", "pass_yd", "pass_yds", "py", "YDS"),
+    "pass_td": ("pass_td", "pass_tds", "TDS"),
+    "pass_int": ("pass_int", "ints", "INTS"),
+    "pass_2pt": ("pass_2pt", "pass_two_pt"),
+    "pass_comp_25p_events": ("pass_comp_25p_events",),  # optional expected counts
     # rushing
-    "rush_yards": ["rush_yards", "rush_yd", "rush_yds", "ry", "YDS.1"],
-    "rush_td": ["rush_td", "rush_tds", "TDS.1"],
-    "rush_2pt": ["rush_2pt", "rush_two_pt"],
-    "rush_att_20p_events": ["rush_att_20p_events"],  # optional expected counts
-    "rush_first_down": ["rush_first_down"],
+    "rush_yards": ("rush_yards", "rush_yd", "rush_yds", "ry", "YDS.1"),
+    "rush_td": ("rush_td", "rush_tds", "TDS.1"),
+    "rush_2pt": ("rush_2pt", "rush_two_pt"),
+    "rush_att_20p_events": ("rush_att_20p_events",),  # optional expected counts
+    "rush_first_down": ("rush_first_down",),
     # receiving
-    "receptions": ["receptions", "rec", "recpt", "REC"],
-    "rec_yards": ["rec_yards", "rec_yd", "rec_yds", "ryds"],
-    "rec_td": ["rec_td", "rec_tds"],
-    "rec_2pt": ["rec_2pt", "rec_two_pt"],
-    "rec_first_down": ["rec_first_down"],
+    "receptions": ("receptions", "rec", "recpt", "REC"),
+    "rec_yards": ("rec_yards", "rec_yd", "rec_yds", "ryds"),
+    "rec_td": ("rec_td", "rec_tds"),
+    "rec_2pt": ("rec_2pt", "rec_two_pt"),
+    "rec_first_down": ("rec_first_down",),
     # long reception buckets (optional)
-    "rec_10_19": ["rec_10_19"],
-    "rec_20_29": ["rec_20_29"],
-    "rec_30_39": ["rec_30_39"],
-    "rec_40_plus": ["rec_40_plus"],
-    "rec_40_plus_td": ["rec_40_plus_td"],
-    "rec_50_plus_td": ["rec_50_plus_td"],
+    "rec_10_19": ("rec_10_19",),
+    "rec_20_29": ("rec_20_29",),
+    "rec_30_39": ("rec_30_39",),
+    "rec_40_plus": ("rec_40_plus",),
+    "rec_40_plus_td": ("rec_40_plus_td",),
+    "rec_50_plus_td": ("rec_50_plus_td",),
     # per-game bonus events (optional)
-    "pg_100_199_rush": ["pg_100_199_rush"],
-    "pg_200_plus_rush": ["pg_200_plus_rush"],
-    "pg_100_199_rec": ["pg_100_199_rec"],
-    "pg_200_plus_rec": ["pg_200_plus_rec"],
-    "pg_100_199_combo": ["pg_100_199_combo"],
-    "pg_200_plus_combo": ["pg_200_plus_combo"],
-    "pg_300_399_pass": ["pg_300_399_pass"],
-    "pg_400_plus_pass": ["pg_400_plus_pass"],
+    "pg_100_199_rush": ("pg_100_199_rush",),
+    "pg_200_plus_rush": ("pg_200_plus_rush",),
+    "pg_100_199_rec": ("pg_100_199_rec",),
+    "pg_200_plus_rec": ("pg_200_plus_rec",),
+    "pg_100_199_combo": ("pg_100_199_combo",),
+    "pg_200_plus_combo": ("pg_200_plus_combo",),
+    "pg_300_399_pass": ("pg_300_399_pass",),
+    "pg_400_plus_pass": ("pg_400_plus_pass",),
 }
 
 IDP_MAP = {
-    "player": ["player", "player_name", "name", "display_name", "PLAYER NAME", "Name"],
-    "position": ["position", "pos", "POS", "Pos"],  # DL/LB/DB
-    "team": ["team", "team_abbr", "team_code", "nfl_team", "TEAM", "Team"],
-    "age": ["age"],
-    "rank": ["RK", "rank", "overall_rank", "#"],
-    "tier": ["TIERS", "tier"],
-    "tackle_solo": ["tackle_solo", "solo", "Tackles Solo"],
-    "tackle_ast": ["tackle_ast", "ast", "Tackles Ast"],
-    "tackles_total": ["tackles_total", "tackles", "Tackles"],
-    "sack": ["sack", "sacks", "Sacks"],
-    "int": ["int", "ints", "Ints"],
-    "ff": ["ff", "forced_fumbles", "Fum Forc"],
-    "fr": ["fr", "fumble_rec", "Fum Rec"],
-    "def_td": ["def_td", "def_tds", "TD Ret"],
-    "pd": ["pd", "passes_defended", "pass_def", "Pass Def"],
-    "safety": ["safety", "safeties", "Saf"],
-    "blk": ["blk", "blocked_kick"],
+    "player": ("player", "player_name", "name", "display_name", "PLAYER NAME", "Name"),
+    "position": ("position", "pos", "POS", "Pos"),  # DL/LB/DB
+    "team": ("team", "team_abbr", "team_code", "nfl_team", "TEAM", "Team"),
+    "age": ("age",),
+    "rank": ("RK", "rank", "overall_rank", "#"),
+    "tier": ("TIERS", "tier"),
+    "tackle_solo": ("tackle_solo", "solo", "Tackles Solo"),
+    "tackle_ast": ("tackle_ast", "ast", "Tackles Ast"),
+    "tackles_total": ("tackles_total", "tackles", "Tackles"),
+    "sack": ("sack", "sacks", "Sacks"),
+    "int": ("int", "ints", "Ints"),
+    "ff": ("ff", "forced_fumbles", "Fum Forc"),
+    "fr": ("fr", "fumble_rec", "Fum Rec"),
+    "def_td": ("def_td", "def_tds", "TD Ret"),
+    "pd": ("pd", "passes_defended", "pass_def", "Pass Def"),
+    "safety": ("safety", "safeties", "Saf"),
+    "blk": ("blk", "blocked_kick"),
 }
 
 ADP_MAP = {
-    "player": ["player", "player_name", "name", "display_name", "Player"],
-    "position": ["position", "pos"],
-    "team": ["team", "team_abbr", "team_code", "nfl_team"],
-    "adp": ["adp", "average_draft_position", "avg_pick", "Overall Rank"],
+    "player": ("player", "player_name", "name", "display_name", "Player"),
+    "position": ("position", "pos"),
+    "team": ("team", "team_abbr", "team_code", "nfl_team"),
+    "adp": ("adp", "average_draft_position", "avg_pick", "Overall Rank"),
+}
+
+# Offense columns that are copied through without position-aware stat logic
+OFFENSE_BASIC_MAP = {
+    k: OFFENSE_MAP[k] for k in ("player", "position", "team", "age", "rank", "tier")
 }
 
+# Reverse indexes for the maps standardize() is called with
+OFFENSE_BASIC_ALIAS_INDEX = _build_alias_index(OFFENSE_BASIC_MAP)
+IDP_ALIAS_INDEX = _build_alias_index(IDP_MAP)
+ADP_ALIAS_INDEX = _build_alias_index(ADP_MAP)
+
+
+# Raw headers whose presence means a file has real projections, not just rankings
+_OFFENSE_PROJ_COLUMNS = frozenset(
+    alias
+    for key in ("pass_yards", "rush_yards", "receptions")
+    for alias in OFFENSE_MAP[key]
+)
+_IDP_PROJ_COLUMNS = frozenset(
+    alias
+    for key in ("tackle_solo", "tackles_total", "sack", "int")
+    for alias in IDP_MAP[key]
+)
+
+
+# Standardized columns stored as pandas categoricals
+STANDARDIZED_CATEGORY_COLS = ("position", "team")
+
 
 # -------------------------------
 # 3) HELPERS AND DATA PROCESSORS
@@ -235,10 +293,11 @@ class DataProcessor:
     """Handles data processing operations with consistent methods."""
 
     @staticmethod
-    def coalesce_column(df: pd.DataFrame, targets: List[str], default=None):
+    def coalesce_column(df: pd.DataFrame, targets: Sequence[str], default=None):
         """Find first matching column from list of candidates."""
+        columns = df.columns  # Index membership is a cached hash lookup
         for t in targets:
-            if t in df.columns:
+            if t in columns:
                 return df[t]
         return pd.Series([default] * len(df))
 
@@ -247,23 +306,132 @@ class DataProcessor:
         """Convert values to numeric, handling commas and invalid data."""
         if pd.isna(value):
             return 0.0
+        if try_float is not None and isinstance(value, str):
+            return try_float(
+                value.replace(",", ""),
+                on_fail=0.0,
+                on_type_error=0.0,
+                allow_underscores=True,
+            )
         try:
             return float(str(value).replace(",", ""))
         except (ValueError, TypeError):
             return 0.0
 
+    @staticmethod
+    def clean_numeric_series(values: pd.Series) -> pd.Series:
+        """Vectorized clean_numeric: strip thousands separators, invalid data -> 0.0."""
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(
+            values
+        ):
+            return values.astype(float).fillna(0.0)
+        as_text = values.astype(str).str.replace(",", "", regex=False)
+        return pd.to_numeric(as_text, errors="coerce").fillna(0.0)
+
     @staticmethod
     def to_numeric_columns(
         df: pd.DataFrame, exclude=("player", "position", "team", "age")
     ) -> pd.DataFrame:
         """Convert all columns except specified ones to numeric."""
-        df_copy = df.copy()
+        # Shallow copy: the converted columns are replaced wholesale below, so
+        # the untouched text columns never need duplicating
+        out = df.copy(deep=False)
+
+        cols = [c for c in df.columns if c not in exclude]
+        if not cols:
+            return out
+
+        block = df[cols]
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in block.dtypes):
+            block = block.apply(pd.to_numeric, errors="coerce")
+        out[cols] = block.fillna(0.0)
+
+        return out
+
+    @staticmethod
+    def fuzzy_align_players(
+        df_left: pd.DataFrame, df_right: pd.DataFrame, threshold: float = 90
+    ) -> pd.Series:
+        """
+        Match each left player to a right player name, indexed like ``df_left``.
+
+        Exact normalized-name matches are used as-is; the remaining names take
+        the closest rapidfuzz WRatio match scoring at least ``threshold``.
+        Without rapidfuzz only exact matches are returned. Unmatched -> NaN.
+        """
+        left = normalize_player_names(df_left["player"])
+        right = normalize_player_names(df_right["player"])
+        canonical = {}
+        for normalized, player in zip(right, df_right["player"]):
+            if isinstance(normalized, str):
+                canonical.setdefault(normalized, player)
+
+        matched = left.map(canonical)
+        if fuzz_process is None or not canonical:
+            return matched
+
+        choices = list(canonical)
+        fuzzy = {}
+        for name in left[matched.isna() & left.notna()].unique():
+            best = fuzz_process.extractOne(
+                name, choices, scorer=fuzz.WRatio, score_cutoff=threshold
+            )
+            if best is not None:
+                fuzzy[name] = canonical[best[0]]
+        return matched.fillna(left.map(fuzzy))
+
+    @staticmethod
+    def lookup_adp(names: pd.Series, adp_names: pd.Series, adp: pd.Series) -> pd.Series:
+        """
+        ADP for each normalized name in ``names``, indexed like ``names``.
+
+        A name listed more than once in the ADP data takes its earliest ADP, so
+        every name gets exactly one value; unmatched names get NaN.
+        """
+        # Share one categorical dtype so the merge joins on integer codes
+        name_dtype = pd.CategoricalDtype(
+            pd.concat([adp_names, names]).dropna().unique()
+        )
+        adp_keys = (
+            pd.DataFrame({"normalized_name": adp_names.astype(name_dtype), "adp": adp})
+            .sort_values("adp", kind="stable")
+            .drop_duplicates("normalized_name")
+        )
+        merged = pd.DataFrame({"normalized_name": names.astype(name_dtype)}).merge(
+            adp_keys, on="normalized_name", how="left", validate="m:1"
+        )
+        return pd.Series(merged["adp"].to_numpy(), index=names.index, name="adp")
 
-        for c in df_copy.columns:
-            if c not in exclude:
-                df_copy[c] = pd.to_numeric(df_copy[c], errors="coerce").fillna(0.0)
+    @staticmethod
+    def fill_adp_fuzzy(
+        pool: pd.DataFrame,
+        pool_names: pd.Series,
+        adp: pd.DataFrame,
+        adp_names: pd.Series,
+        threshold: float,
+    ) -> pd.Series:
+        """
+        ``pool["adp"]`` with missing values filled from fuzzy name matches.
 
-        return df_copy
+        ADP names that already matched a pool player exactly are not offered
+        as candidates, and a fuzzy match takes its name's earliest ADP, the
+        same rule as ``lookup_adp``. Without rapidfuzz nothing new is filled.
+        """
+        filled = pool["adp"].copy()
+        unmatched = filled.isna()
+        taken = adp_names.isin(pool_names[~unmatched].dropna())
+
+        aligned = DataProcessor.fuzzy_align_players(
+            pool[unmatched], adp[~taken.to_numpy()], threshold
+        ).dropna()
+        filled.loc[aligned.index] = DataProcessor.lookup_adp(
+            normalize_player_names(aligned), adp_names, adp["adp"]
+        )
+        return filled
+
+
+# Digits in depth-chart style positions ("WR1", "DE2")
+_POS_DIGIT_RE = re.compile(r"\d+")
 
 
 class PositionMapper:
@@ -299,15 +467,23 @@ class PositionMapper:
         if pd.isna(pos_str) or pos_str == "":
             return ""
 
-        import re
-
         # Remove numbers and common suffixes
-        pos = re.sub(r"\d+", "", str(pos_str)).upper()
+        pos = _POS_DIGIT_RE.sub("", str(pos_str)).upper()
         return cls.POSITION_MAP.get(pos, pos)
 
+    @classmethod
+    def extract_position_series(cls, positions: pd.Series) -> pd.Series:
+        """Vectorized extract_position over a whole column of position strings."""
+        # Object dtype keeps Python's re and str.upper semantics
+        pos = positions.astype(str).astype(object)
+        pos = pos.str.replace(_POS_DIGIT_RE, "", regex=True)
+        pos = pos.str.upper()
+        pos = pos.map(cls.POSITION_MAP).fillna(pos)
+        return pos.where(positions.notna() & (positions != ""), "")
+
 
 # Legacy functions for backward compatibility
-def coalesce_column(df: pd.DataFrame, targets: List[str], default=None):
+def coalesce_column(df: pd.DataFrame, targets: Sequence[str], default=None):
     return DataProcessor.coalesce_column(df, targets, default)
 
 
@@ -315,9 +491,120 @@ def extract_position(pos_str: str) -> str:
     return PositionMapper.extract_position(pos_str)
 
 
+# Offensive stat columns and the scoring-config keys that weight them (parallel)
+OFFENSE_STAT_COLS = (
+    "pass_yards",
+    "pass_td",
+    "pass_int",
+    "pass_2pt",
+    "rush_yards",
+    "rush_td",
+    "rush_2pt",
+    "receptions",
+    "rec_yards",
+    "rec_td",
+    "rec_2pt",
+    "rush_first_down",
+    "rec_first_down",
+    "pass_comp_25p_events",
+    "rush_att_20p_events",
+    "rec_10_19",
+    "rec_20_29",
+    "rec_30_39",
+    "rec_40_plus",
+    "rec_40_plus_td",
+    "rec_50_plus_td",
+    "pg_100_199_rush",
+    "pg_200_plus_rush",
+    "pg_100_199_rec",
+    "pg_200_plus_rec",
+    "pg_100_199_combo",
+    "pg_200_plus_combo",
+    "pg_300_399_pass",
+    "pg_400_plus_pass",
+)
+OFFENSE_WEIGHT_KEYS = (
+    "pass_yd",
+    "pass_td",
+    "pass_int",
+    "pass_2pt",
+    "rush_yd",
+    "rush_td",
+    "rush_2pt",
+    "rec",
+    "rec_yd",
+    "rec_td",
+    "rec_2pt",
+    "first_down_rb",
+    "first_down_wr",
+    "bonus_25_plus_completions",
+    "bonus_20_plus_carries",
+    "rec_10_19_bonus",
+    "rec_20_29_bonus",
+    "rec_30_39_bonus",
+    "rec_40_plus_bonus",
+    "rec_40_plus_td_bonus",
+    "rec_50_plus_td_bonus",
+    "bonus_100_199_rush_game",
+    "bonus_200_plus_rush_game",
+    "bonus_100_199_rec_game",
+    "bonus_200_plus_rec_game",
+    "bonus_100_199_combo_game",
+    "bonus_200_plus_combo_game",
+    "bonus_300_399_pass_game",
+    "bonus_400_plus_pass_game",
+)
+
+# IDP stat columns (excluding tackles); scoring-config keys share the names
+IDP_STAT_COLS = ("sack", "int", "ff", "fr", "def_td", "pd", "safety", "blk")
+
+
+@lru_cache(maxsize=8)
+def _cached_weights(keys: tuple, scoring_items: tuple) -> np.ndarray:
+    weights = dict(scoring_items)
+    vector = np.array([weights.get(key, 0.0) for key in keys], dtype=float)
+    vector.flags.writeable = False  # shared between calls
+    return vector
+
+
+def scoring_weights(keys: tuple, scoring_config: Dict[str, float]) -> np.ndarray:
+    """Weight vector for ``keys``, cached per distinct scoring config."""
+    try:
+        return _cached_weights(keys, tuple(sorted(scoring_config.items())))
+    except TypeError:  # unhashable config values; build uncached
+        return np.array([scoring_config.get(key, 0.0) for key in keys], dtype=float)
+
+
+def _weighted_stat_sum(df: pd.DataFrame, cols, weights: np.ndarray, start=None):
+    """
+    Sum of stat * weight across ``cols`` for every row (missing stats count as 0).
+
+    The weighted products are accumulated left to right into a single float64
+    vector rather than a BLAS dot product so totals match a term-by-term sum
+    exactly; exact point ties decide ranking order downstream.
+    """
+    if start is None:
+        total = np.zeros(len(df))
+    else:
+        total = np.array(start, dtype=float)
+    for col, weight in zip(cols, weights):
+        if col in df.columns:
+            total += df[col].to_numpy(dtype=float) * weight
+    return total
+
+
 class ScoringEngine:
     """Handles all scoring calculations with clean separation of concerns."""
 
+    # (base points, decay factor) for ranking-based scoring; IDP uses the default
+    RANK_DECAY = {
+        "QB": (280, 0.05),
+        "RB": (250, 0.04),
+        "WR": (250, 0.04),
+        "TE": (200, 0.06),
+    }
+    DEFAULT_RANK_DECAY = (180, 0.03)
+
     @staticmethod
     def assign_points_from_rankings(df: pd.DataFrame, position: str) -> pd.Series:
         """
@@ -328,18 +615,35 @@ class ScoringEngine:
             rank = pd.to_numeric(df["rank"], errors="coerce").fillna(999)
 
             # Position-specific point ranges
-            if position in ["QB"]:
-                base_points, decay_factor = 280, 0.05
-            elif position in ["RB", "WR"]:
-                base_points, decay_factor = 250, 0.04
-            elif position in ["TE"]:
-                base_points, decay_factor = 200, 0.06
-            else:  # IDP positions
-                base_points, decay_factor = 180, 0.03
+            base_points, decay_factor = ScoringEngine.RANK_DECAY.get(
+                position, ScoringEngine.DEFAULT_RANK_DECAY
+            )
 
             return base_points * np.exp(-decay_factor * (rank - 1))
         else:
-            return pd.Series([100.0] * len(df))
+            return pd.Series(100.0, index=df.index)
+
+    @staticmethod
+    def assign_points_all_positions(df: pd.DataFrame) -> pd.Series:
+        """Ranking-based points for every position at once; blank positions get 0."""
+        positions = df["position"]
+        has_position = (positions.notna() & (positions != "")).to_numpy()
+        if "rank" not in df.columns:
+            return pd.Series(np.where(has_position, 100.0, 0.0), index=df.index)
+
+        rank = pd.to_numeric(df["rank"], errors="coerce").fillna(999).to_numpy()
+        default_base, default_decay = ScoringEngine.DEFAULT_RANK_DECAY
+        base_points = positions.map(
+            {pos: base for pos, (base, _) in ScoringEngine.RANK_DECAY.items()}
+        )
+        decay_factor = positions.map(
+            {pos: decay for pos, (_, decay) in ScoringEngine.RANK_DECAY.items()}
+        )
+        base_points = base_points.fillna(default_base).to_numpy(dtype=float)
+        decay_factor = decay_factor.fillna(default_decay).to_numpy(dtype=float)
+
+        points = base_points * np.exp(-decay_factor * (rank - 1))
+        return pd.Series(np.where(has_position, points, 0.0), index=df.index)
 
     @staticmethod
     def apply_offense_scoring(
@@ -370,66 +674,11 @@ class ScoringEngine:
             else:
                 df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
 
-        # Use .get() with default values to avoid KeyError
-        return (
-            df.get("pass_yards", pd.Series(0.0, index=df.index))
-            * scoring_config.get("pass_yd", 0.0)
-            + df.get("pass_td", pd.Series(0.0, index=df.index))
-            * scoring_config.get("pass_td", 0.0)
-            + df.get("pass_int", pd.Series(0.0, index=df.index))
-            * scoring_config.get("pass_int", 0.0)
-            + df.get("pass_2pt", pd.Series(0.0, index=df.index))
-            * scoring_config.get("pass_2pt", 0.0)
-            + df.get("rush_yards", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rush_yd", 0.0)
-            + df.get("rush_td", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rush_td", 0.0)
-            + df.get("rush_2pt", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rush_2pt", 0.0)
-            + df.get("receptions", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec", 0.0)
-            + df.get("rec_yards", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_yd", 0.0)
-            + df.get("rec_td", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_td", 0.0)
-            + df.get("rec_2pt", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_2pt", 0.0)
-            + df.get("rush_first_down", pd.Series(0.0, index=df.index))
-            * scoring_config.get("first_down_rb", 0.0)
-            + df.get("rec_first_down", pd.Series(0.0, index=df.index))
-            * scoring_config.get("first_down_wr", 0.0)
-            + df.get("pass_comp_25p_events", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_25_plus_completions", 0.0)
-            + df.get("rush_att_20p_events", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_20_plus_carries", 0.0)
-            + df.get("rec_10_19", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_10_19_bonus", 0.0)
-            + df.get("rec_20_29", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_20_29_bonus", 0.0)
-            + df.get("rec_30_39", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_30_39_bonus", 0.0)
-            + df.get("rec_40_plus", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_40_plus_bonus", 0.0)
-            + df.get("rec_40_plus_td", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_40_plus_td_bonus", 0.0)
-            + df.get("rec_50_plus_td", pd.Series(0.0, index=df.index))
-            * scoring_config.get("rec_50_plus_td_bonus", 0.0)
-            + df.get("pg_100_199_rush", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_100_199_rush_game", 0.0)
-            + df.get("pg_200_plus_rush", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_200_plus_rush_game", 0.0)
-            + df.get("pg_100_199_rec", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_100_199_rec_game", 0.0)
-            + df.get("pg_200_plus_rec", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_200_plus_rec_game", 0.0)
-            + df.get("pg_100_199_combo", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_100_199_combo_game", 0.0)
-            + df.get("pg_200_plus_combo", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_200_plus_combo_game", 0.0)
-            + df.get("pg_300_399_pass", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_300_399_pass_game", 0.0)
-            + df.get("pg_400_plus_pass", pd.Series(0.0, index=df.index))
-            * scoring_config.get("bonus_400_plus_pass_game", 0.0)
+        # One pass over a stat matrix and weight vector; stats missing from the
+        # frame contribute zero
+        weights = scoring_weights(OFFENSE_WEIGHT_KEYS, scoring_config)
+        return pd.Series(
+            _weighted_stat_sum(df, OFFENSE_STAT_COLS, weights), index=df.index
         )
 
     @staticmethod
@@ -441,44 +690,23 @@ class ScoringEngine:
 
         # Handle different tackle scoring systems
         if "tackle_solo" in df.columns and "tackle_ast" in df.columns:
-            tackle_points = df.get(
-                "tackle_solo", pd.Series(0.0, index=df.index)
-            ) * scoring_config.get("tackle_solo", 0.0) + df.get(
-                "tackle_ast", pd.Series(0.0, index=df.index)
-            ) * scoring_config.get(
-                "tackle_ast", 0.0
-            )
+            tackle_points = df["tackle_solo"] * scoring_config.get(
+                "tackle_solo", 0.0
+            ) + df["tackle_ast"] * scoring_config.get("tackle_ast", 0.0)
         elif "tackles_total" in df.columns:
             # Assume roughly 60% solo, 40% assisted for total tackle value
             avg_tackle_value = (
                 scoring_config.get("tackle_solo", 0.0) * 0.6
                 + scoring_config.get("tackle_ast", 0.0) * 0.4
             )
-            tackle_points = (
-                df.get("tackles_total", pd.Series(0.0, index=df.index))
-                * avg_tackle_value
-            )
+            tackle_points = df["tackles_total"] * avg_tackle_value
         else:
-            tackle_points = pd.Series(0.0, index=df.index)
-
-        return (
-            tackle_points
-            + df.get("sack", pd.Series(0.0, index=df.index))
-            * scoring_config.get("sack", 0.0)
-            + df.get("int", pd.Series(0.0, index=df.index))
-            * scoring_config.get("int", 0.0)
-            + df.get("ff", pd.Series(0.0, index=df.index))
-            * scoring_config.get("ff", 0.0)
-            + df.get("fr", pd.Series(0.0, index=df.index))
-            * scoring_config.get("fr", 0.0)
-            + df.get("def_td", pd.Series(0.0, index=df.index))
-            * scoring_config.get("def_td", 0.0)
-            + df.get("pd", pd.Series(0.0, index=df.index))
-            * scoring_config.get("pd", 0.0)
-            + df.get("safety", pd.Series(0.0, index=df.index))
-            * scoring_config.get("safety", 0.0)
-            + df.get("blk", pd.Series(0.0, index=df.index))
-            * scoring_config.get("blk", 0.0)
+            tackle_points = None
+
+        weights = scoring_weights(IDP_STAT_COLS, scoring_config)
+        return pd.Series(
+            _weighted_stat_sum(df, IDP_STAT_COLS, weights, start=tackle_points),
+            index=df.index,
         )
 
 
@@ -486,11 +714,36 @@ class DataStandardizer:
     """Handles data standardization with position-aware column mapping."""
 
     @staticmethod
-    def standardize(df: pd.DataFrame, mapping: Dict[str, List[str]]) -> pd.DataFrame:
-        """Basic column standardization using mapping dictionary."""
-        out = pd.DataFrame()
-        for k, candidates in mapping.items():
-            out[k] = DataProcessor.coalesce_column(df, candidates, 0)
+    def standardize(
+        df: pd.DataFrame,
+        mapping: Dict[str, Sequence[str]],
+        aliases: Optional[Dict[str, tuple]] = None,
+    ) -> pd.DataFrame:
+        """Basic column standardization using mapping dictionary.
+
+        ``aliases`` is the mapping's prebuilt alias index, if it has one.
+        """
+        if aliases is None:
+            aliases = _build_alias_index(mapping)
+
+        # One pass over the headers, keeping each key's most preferred alias
+        sources = {}
+        for col in df.columns:
+            if col not in aliases:
+                continue
+            canonical, preference = aliases[col]
+            if canonical not in sources or preference < sources[canonical][1]:
+                sources[canonical] = (col, preference)
+
+        out = pd.DataFrame(
+            {k: df[sources[k][0]] if k in sources else 0 for k in mapping},
+            index=df.index,
+        )
+
+        # Low-cardinality labels compare and group on integer codes
+        for col in STANDARDIZED_CATEGORY_COLS:
+            if col in out.columns:
+                out[col] = out[col].astype("category")
         return out
 
     @staticmethod
@@ -499,124 +752,62 @@ class DataStandardizer:
         Position-aware column mapping for offense projections.
         Handles cases where YDS/TDS could be passing or receiving stats.
         """
-        out = pd.DataFrame()
-
         # Basic columns that don't need position logic
-        basic_mapping = {
-            "player": [
-                "player",
-                "player_name",
-                "name",
-                "display_name",
-                "PLAYER NAME",
-                "Player",
-            ],
-            "position": ["position", "pos", "POS", "Pos"],
-            "team": ["team", "team_abbr", "team_code", "nfl_team", "TEAM", "Team"],
-            "age": ["age"],
-            "rank": ["RK", "rank", "overall_rank"],
-            "tier": ["TIERS", "tier"],
-        }
-
-        for k, candidates in basic_mapping.items():
-            out[k] = DataProcessor.coalesce_column(df, candidates, 0)
+        out = DataStandardizer.standardize(
+            df, OFFENSE_BASIC_MAP, OFFENSE_BASIC_ALIAS_INDEX
+        )
 
         # Get positions to determine stat mapping
-        positions = DataProcessor.coalesce_column(df, basic_mapping["position"])
+        positions = DataProcessor.coalesce_column(df, OFFENSE_MAP["position"])
 
         # Initialize all stat columns to 0
-        stat_cols = [
-            "pass_yards",
-            "pass_td",
-            "pass_int",
-            "pass_2pt",
-            "pass_comp_25p_events",
-            "rush_yards",
-            "rush_td",
-            "rush_2pt",
-            "rush_att_20p_events",
-            "rush_first_down",
-            "receptions",
-            "rec_yards",
-            "rec_td",
-            "rec_2pt",
-            "rec_first_down",
-            "rec_10_19",
-            "rec_20_29",
-            "rec_30_39",
-            "rec_40_plus",
-            "rec_40_plus_td",
-            "rec_50_plus_td",
-            "pg_100_199_rush",
-            "pg_200_plus_rush",
-            "pg_100_199_rec",
-            "pg_200_plus_rec",
-            "pg_100_199_combo",
-            "pg_200_plus_combo",
-            "pg_300_399_pass",
-            "pg_400_plus_pass",
-        ]
-
-        for col in stat_cols:
-            out[col] = pd.Series([0.0] * len(df))
+        stat_cols = [k for k in OFFENSE_MAP if k not in OFFENSE_BASIC_MAP]
+        out = out.reindex(columns=list(out.columns) + stat_cols, fill_value=0.0)
 
         # Position-specific stat mapping
-        for i, pos in enumerate(positions):
-            pos_clean = PositionMapper.extract_position(str(pos))
-            DataStandardizer._map_position_stats(df, out, i, pos_clean)
+        pos_clean = PositionMapper.extract_position_series(positions.astype(str))
+        DataStandardizer._map_position_stats(df, out, pos_clean)
 
         return out
 
     @staticmethod
-    def _map_position_stats(
-        df: pd.DataFrame, out: pd.DataFrame, index: int, position: str
-    ):
-        """Map stats based on position for a specific row."""
-        clean_numeric = DataProcessor.clean_numeric
-
-        if position == "QB":
-            # For QBs: YDS = passing yards, TDS = passing TDs
-            if "YDS" in df.columns:
-                out.loc[index, "pass_yards"] = clean_numeric(df.iloc[index]["YDS"])
-            if "TDS" in df.columns:
-                out.loc[index, "pass_td"] = clean_numeric(df.iloc[index]["TDS"])
-            if "INTS" in df.columns:
-                out.loc[index, "pass_int"] = clean_numeric(df.iloc[index]["INTS"])
-            if "YDS.1" in df.columns:
-                out.loc[index, "rush_yards"] = clean_numeric(df.iloc[index]["YDS.1"])
-            if "TDS.1" in df.columns:
-                out.loc[index, "rush_td"] = clean_numeric(df.iloc[index]["TDS.1"])
-
-        elif position in ["WR", "TE"]:
-            # For WR/TE: YDS = receiving yards, TDS = receiving TDs
-            if "REC" in df.columns:
-                out.loc[index, "receptions"] = clean_numeric(df.iloc[index]["REC"])
-            if "YDS" in df.columns:
-                out.loc[index, "rec_yards"] = clean_numeric(df.iloc[index]["YDS"])
-            if "TDS" in df.columns:
-                out.loc[index, "rec_td"] = clean_numeric(df.iloc[index]["TDS"])
-            if "YDS.1" in df.columns:
-                out.loc[index, "rush_yards"] = clean_numeric(df.iloc[index]["YDS.1"])
-            if "TDS.1" in df.columns:
-                out.loc[index, "rush_td"] = clean_numeric(df.iloc[index]["TDS.1"])
-
-        elif position == "RB":
-            # For RB: YDS.1 = rushing yards, TDS.1 = rushing TDs, YDS = receiving yards, TDS = receiving TDs
-            if "REC" in df.columns:
-                out.loc[index, "receptions"] = clean_numeric(df.iloc[index]["REC"])
-            if "YDS" in df.columns:
-                out.loc[index, "rec_yards"] = clean_numeric(df.iloc[index]["YDS"])
-            if "TDS" in df.columns:
-                out.loc[index, "rec_td"] = clean_numeric(df.iloc[index]["TDS"])
-            if "YDS.1" in df.columns:
-                out.loc[index, "rush_yards"] = clean_numeric(df.iloc[index]["YDS.1"])
-            if "TDS.1" in df.columns:
-                out.loc[index, "rush_td"] = clean_numeric(df.iloc[index]["TDS.1"])
+    def _map_position_stats(df: pd.DataFrame, out: pd.DataFrame, positions: pd.Series):
+        """Map stats based on position, filling whole columns with boolean masks."""
+        # QBs: YDS/TDS are passing stats. RB/WR/TE: YDS/TDS are receiving stats.
+        # YDS.1/TDS.1 are rushing stats for all four positions.
+        is_qb = (positions == "QB").to_numpy()
+        is_skill = positions.isin(["RB", "WR", "TE"]).to_numpy()
+        is_offense = is_qb | is_skill
+
+        column_targets = [
+            ("YDS", is_qb, "pass_yards"),
+            ("TDS", is_qb, "pass_td"),
+            ("INTS", is_qb, "pass_int"),
+            ("REC", is_skill, "receptions"),
+            ("YDS", is_skill, "rec_yards"),
+            ("TDS", is_skill, "rec_td"),
+            ("YDS.1", is_offense, "rush_yards"),
+            ("TDS.1", is_offense, "rush_td"),
+        ]
+
+        cleaned = {}
+        for source, rows, target in column_targets:
+            if source not in df.columns or not rows.any():
+                continue
+            if source not in cleaned:
+                cleaned[source] = DataProcessor.clean_numeric_series(
+                    df[source]
+                ).to_numpy(dtype=float)
+            out[target] = np.where(rows, cleaned[source], out[target].to_numpy())
 
 
 # Legacy functions for backward compatibility
-def standardize(df: pd.DataFrame, mapping: Dict[str, List[str]]) -> pd.DataFrame:
-    return DataStandardizer.standardize(df, mapping)
+def standardize(
+    df: pd.DataFrame,
+    mapping: Dict[str, Sequence[str]],
+    aliases: Optional[Dict[str, tuple]] = None,
+) -> pd.DataFrame:
+    return DataStandardizer.standardize(df, mapping, aliases)
 
 
 def standardize_offense_position_aware(df: pd.DataFrame) -> pd.DataFrame:
@@ -641,9 +832,67 @@ def assign_points_from_rankings(df: pd.DataFrame, position: str) -> pd.Series:
     return ScoringEngine.assign_points_from_rankings(df, position)
 
 
+def assign_points_all_positions(df: pd.DataFrame) -> pd.Series:
+    return ScoringEngine.assign_points_all_positions(df)
+
+
 class DraftPriorityCalculator:
     """Handles the complex Draft Priority scoring algorithm."""
 
+    # ADP reality check payoff, rows = ADP bucket, columns = round bonus tier
+    ADP_ADJUSTMENTS = np.array(
+        [
+            # Market consensus early pick - validate high bonuses
+            # (agrees / suggests higher value / strongly disagrees)
+            [0, 8, 15, 15],
+            # Market consensus mid-round pick - moderate bonuses appropriate
+            [-25, -10, 5, 5],
+            # Late ADP - high bonuses likely wrong
+            [-40, -25, 0, 0],
+            # Very late/undrafted ADP - severely penalize high bonuses
+            [-50, -35, -15, 0],
+            # No ADP data (999 placeholder) - no adjustment
+            [0, 0, 0, 0],
+        ]
+    )
+
+    # Position-specific ADP thresholds for round bonuses
+    _EARLY = {
+        "QB": 8,  # Only top 8 QBs should get major bonuses (QB1-QB8)
+        "RB": 12,  # RBs taken in top 12 are consensus RB1s
+        "WR": 18,  # WRs taken in top 18 are consensus WR1s
+        "TE": 30,  # TEs taken in top 30 are startable
+        "DL": 60,  # IDP taken in top 60 are consensus starters
+        "LB": 60,
+        "DB": 80,
+    }
+
+    _MID = {
+        "QB": 24,  # QBs after pick 24 should have limited bonuses
+        "RB": 24,  # RBs after pick 24 are RB2s/flex
+        "WR": 36,  # WRs after pick 36 are WR2s/flex
+        "TE": 60,  # TEs after pick 60 are backup/streaming
+        "DL": 120,  # IDP after pick 120 are late-round fills
+        "LB": 120,
+        "DB": 150,
+    }
+
+    _LATE = {
+        "QB": 60,  # QBs after pick 60 are bench/streaming
+        "RB": 48,  # RBs after pick 48 are handcuffs/dart throws
+        "WR": 72,  # WRs after pick 72 are WR3s/depth
+        "TE": 120,  # TEs after pick 120 are waiver wire
+        "DL": 180,
+        "LB": 180,
+        "DB": 200,
+    }
+
+    # Same thresholds as arrays indexed by position code, default appended last
+    _POS_CODE = {"QB": 0, "RB": 1, "WR": 2, "TE": 3, "DL": 4, "LB": 5, "DB": 6}
+    _EARLY_ARR = np.array([*map(_EARLY.get, _POS_CODE), 24], dtype=float)
+    _MID_ARR = np.array([*map(_MID.get, _POS_CODE), 48], dtype=float)
+    _LATE_ARR = np.array([*map(_LATE.get, _POS_CODE), 96], dtype=float)
+
     def __init__(self, league_config: dict, draft_strategy_config: dict = None):
         self.teams = league_config["num_teams"]
         self.is_superflex = league_config["superflex"]
@@ -653,6 +902,7 @@ class DraftPriorityCalculator:
         self.strategy_config = (
             draft_strategy_config or self._get_default_strategy_config()
         )
+        self._compile_round_tiers()
 
     def _get_default_strategy_config(self) -> dict:
         """Default strategy based on statistical thresholds rather than hardcoded names."""
@@ -705,9 +955,58 @@ class DraftPriorityCalculator:
             }
         }
 
+    def _compile_round_tiers(self):
+        """
+        Flatten the round bonus criteria into arrays indexed [tier, position].
+
+        Each (tier, position) cell holds the VORP floor and ceiling plus the
+        overall and positional rank ceilings (min_rank and max_rank are both
+        ceilings). Positions without criteria in a tier never match it; the
+        extra last position slot catches positions no tier mentions.
+        """
+        tiers = list(self.strategy_config["round_bonuses"].values())
+        positions = sorted(
+            {pos for tier in tiers for pos, crit in tier["criteria"].items() if crit}
+        )
+        self._tier_pos_index = {pos: i for i, pos in enumerate(positions)}
+        self._tier_bonus = np.array([tier["bonus"] for tier in tiers], dtype=float)
+
+        shape = (len(tiers), len(positions) + 1)
+        self._tier_applies = np.zeros(shape, dtype=bool)
+        self._tier_limits = np.empty(shape + (4,))
+        self._tier_limits[...] = [-np.inf, np.inf, np.inf, np.inf]
+
+        for t, tier in enumerate(tiers):
+            for pos, criteria in tier["criteria"].items():
+                if not criteria:
+                    continue
+                i = self._tier_pos_index[pos]
+                self._tier_applies[t, i] = True
+                self._tier_limits[t, i] = [
+                    criteria.get("min_vorp", -np.inf),
+                    criteria.get("max_vorp", np.inf),
+                    min(
+                        criteria.get("min_rank", np.inf),
+                        criteria.get("max_rank", np.inf),
+                    ),
+                    min(
+                        criteria.get("min_pos_rank", np.inf),
+                        criteria.get("max_pos_rank", np.inf),
+                    ),
+                ]
+
     def calculate_draft_priority(self, overall_df: pd.DataFrame) -> pd.Series:
         """Calculate Draft Priority scores for all players."""
-        draft_priorities = []
+        pos = overall_df["position"].to_numpy(dtype=object)
+        vorp = overall_df["VORP"].to_numpy(dtype=float)
+        points = overall_df["Points"].to_numpy(dtype=float)
+        adp_diff = overall_df["ADP_Diff"].to_numpy(dtype=float)
+
+        # Coerce ADP and rank once for the whole board; missing means undrafted
+        adp, rank = (
+            pd.to_numeric(overall_df[col], errors="coerce").fillna(999).to_numpy(float)
+            for col in ("adp", "Rank")
+        )
 
         # Precompute normalization values
         max_vorp = overall_df["VORP"].max()
@@ -716,63 +1015,19 @@ class DraftPriorityCalculator:
 
         # Precompute position rankings for efficient lookup
         position_rankings = self._calculate_position_rankings(overall_df)
-
-        for i in range(len(overall_df)):
-            player = overall_df.iloc[i]
-            priority = self._calculate_single_player_priority(
-                player, max_vorp, min_vorp, max_points, position_rankings
-            )
-            draft_priorities.append(round(priority, 1))
-
-        return pd.Series(draft_priorities)
-
-    def _calculate_position_rankings(self, overall_df: pd.DataFrame) -> dict:
-        """Calculate position-specific rankings for all players."""
-        position_rankings = {}
-
-        for pos in overall_df["position"].unique():
-            if pd.isna(pos) or pos == "":
-                continue
-
-            pos_players = (
-                overall_df[overall_df["position"] == pos]
-                .sort_values(["Points", "VORP"], ascending=[False, False])
-                .reset_index(drop=True)
+        pos_rank = (
+            position_rankings.reindex(
+                pd.MultiIndex.from_arrays(
+                    [overall_df["position"], overall_df["player"].astype(str)]
+                )
             )
-
-            # Create mapping from player name to position rank
-            pos_ranks = {}
-            for idx, (_, player) in enumerate(pos_players.iterrows(), 1):
-                pos_ranks[player["player"]] = idx
-
-            position_rankings[pos] = pos_ranks
-
-        return position_rankings
-
-    def _calculate_single_player_priority(
-        self,
-        player,
-        max_vorp: float,
-        min_vorp: float,
-        max_points: float,
-        position_rankings: dict,
-    ) -> float:
-        """Calculate Draft Priority for a single player."""
-        pos = player["position"]
-        vorp = player["VORP"]
-        adp_diff = player["ADP_Diff"]
-        adp = pd.to_numeric(player["adp"], errors="coerce")
-        if pd.isna(adp):
-            adp = 999
-        rank = player["Rank"]
-        player_name = str(player["player"])
-
-        # Get position rank
-        pos_rank = position_rankings.get(pos, {}).get(player_name, 999)
+            .fillna(999)
+            .to_numpy(dtype=float)
+        )
 
         # Base talent score (0-100)
         talent_score = self._calculate_talent_score(
-            vorp, player["Points"], max_vorp, min_vorp, max_points
+            vorp, points, max_vorp, min_vorp, max_points
         )
 
         # Statistical-based round bonuses (no hardcoded names)
@@ -790,11 +1045,15 @@ class DraftPriorityCalculator:
         reach_penalty = self._calculate_reach_penalty(adp, adp_diff)
 
         # Penalize negative VORP players unless they have round bonus
-        if vorp < 0 and round_bonus == 0:
-            talent_score = max(0, talent_score * 0.3)
+        damped = talent_score * 0.3
+        talent_score = np.where(
+            (vorp < 0) & (round_bonus == 0),
+            np.where(damped > 0, damped, 0.0),
+            talent_score,
+        )
 
         # Calculate final Draft Priority Score
-        return (
+        priority = (
             talent_score * pos_multiplier
             + round_bonus
             + adp_adjustment
@@ -802,21 +1061,45 @@ class DraftPriorityCalculator:
             + value_bonus
             + reach_penalty
         )
+        # Python's round() keeps ties identical to the per-player scores;
+        # np.round rounds halves differently on binary floats
+        return pd.Series(
+            [round(value, 1) for value in priority.tolist()], index=overall_df.index
+        )
+
+    def _calculate_position_rankings(self, overall_df: pd.DataFrame) -> pd.Series:
+        """Calculate position-specific rankings, indexed by (position, player)."""
+        valid = overall_df[
+            overall_df["position"].notna() & (overall_df["position"] != "")
+        ]
+        ranked = valid.sort_values(["Points", "VORP"], ascending=[False, False])
+        pos_ranks = ranked.groupby("position", sort=False).cumcount().add(1)
+
+        # Unnamed players still take up a rank slot but can never be looked up
+        named = ranked["player"].notna().to_numpy()
+        ranked, pos_ranks = ranked[named], pos_ranks[named]
+
+        position_rankings = pd.Series(
+            pos_ranks.to_numpy(),
+            index=pd.MultiIndex.from_arrays([ranked["position"], ranked["player"]]),
+        )
+        # A repeated name within a position keeps its lowest-ranked entry
+        return position_rankings[~position_rankings.index.duplicated(keep="last")]
 
     def _calculate_talent_score(
         self,
-        vorp: float,
-        points: float,
+        vorp: np.ndarray,
+        points: np.ndarray,
         max_vorp: float,
         min_vorp: float,
         max_points: float,
-    ) -> float:
+    ) -> np.ndarray:
         """Calculate base talent score from VORP and points."""
         # Normalize VORP to 0-60 scale
         if max_vorp != min_vorp:
             vorp_score = ((vorp - min_vorp) / (max_vorp - min_vorp)) * 60
         else:
-            vorp_score = 30
+            vorp_score = np.full(len(vorp), 30.0)
 
         # Add points component (0-40 scale) for raw production
         points_score = (points / max_points) * 40 if max_points > 0 else 0
@@ -824,167 +1107,120 @@ class DraftPriorityCalculator:
         return vorp_score + points_score
 
     def _calculate_statistical_round_bonus(
-        self, pos: str, vorp: float, overall_rank: int, pos_rank: int
-    ) -> float:
+        self,
+        pos: np.ndarray,
+        vorp: np.ndarray,
+        overall_rank: np.ndarray,
+        pos_rank: np.ndarray,
+    ) -> np.ndarray:
         """Calculate round-based priority bonus using statistical thresholds instead of hardcoded names."""
+        pos_idx = (
+            pd.Series(pos, dtype=object)
+            .map(self._tier_pos_index)
+            .fillna(len(self._tier_pos_index))
+            .to_numpy(dtype=int)
+        )
+        bonus = np.zeros(len(pos))
+        unassigned = np.ones(len(pos), dtype=bool)
+
+        # Check each round tier in order (most valuable first); comparisons are
+        # negated failure checks so missing values pass as they always have
+        for t, tier_bonus in enumerate(self._tier_bonus):
+            limits = self._tier_limits[t, pos_idx]
+            meets_criteria = (
+                unassigned
+                & self._tier_applies[t, pos_idx]
+                & ~(vorp < limits[:, 0])
+                & ~(vorp > limits[:, 1])
+                & ~(overall_rank > limits[:, 2])
+                & ~(pos_rank > limits[:, 3])
+            )
+            bonus[meets_criteria] = tier_bonus
+            unassigned &= ~meets_criteria
 
-        # Check each round tier in order (most valuable first)
-        for round_tier, config in self.strategy_config["round_bonuses"].items():
-            bonus = config["bonus"]
-            criteria = config["criteria"].get(pos, {})
-
-            if not criteria:
-                continue
-
-            # Check if player meets all criteria for this round tier
-            meets_criteria = True
-
-            if "min_vorp" in criteria and vorp < criteria["min_vorp"]:
-                meets_criteria = False
-
-            if "max_vorp" in criteria and vorp > criteria["max_vorp"]:
-                meets_criteria = False
-
-            if "min_rank" in criteria and overall_rank > criteria["min_rank"]:
-                meets_criteria = False
-
-            if "max_rank" in criteria and overall_rank > criteria["max_rank"]:
-                meets_criteria = False
-
-            if "min_pos_rank" in criteria and pos_rank > criteria["min_pos_rank"]:
-                meets_criteria = False
-
-            if "max_pos_rank" in criteria and pos_rank > criteria["max_pos_rank"]:
-                meets_criteria = False
-
-            if meets_criteria:
-                return bonus
-
-        return 0
+        return bonus
 
-    def _get_position_multiplier(self, pos: str) -> float:
+    def _get_position_multiplier(self, pos: np.ndarray) -> np.ndarray:
         """Get position-based scoring multiplier."""
-        if pos == "QB" and self.is_superflex:
-            return 1.05  # Very reduced superflex boost
-        elif pos == "TE":
-            return 1.1  # Small TE scarcity boost
-        elif pos in ["DL", "LB", "DB"]:
-            return 0.8  # IDP gets lower base multiplier
-        return 1.0
-
-    def _calculate_elite_bonus(self, rank: int, vorp: float) -> float:
+        return np.select(
+            [
+                (pos == "QB") & self.is_superflex,  # Very reduced superflex boost
+                pos == "TE",  # Small TE scarcity boost
+                np.isin(pos, ["DL", "LB", "DB"]),  # IDP gets lower base multiplier
+            ],
+            [1.05, 1.1, 0.8],
+            default=1.0,
+        )
+
+    def _calculate_elite_bonus(self, rank: np.ndarray, vorp: np.ndarray) -> np.ndarray:
         """Calculate elite player bonus."""
-        if rank <= 5 and vorp > 50:
-            return 20
-        elif rank <= 12 and vorp > 30:
-            return 15
-        elif rank <= 24 and vorp > 15:
-            return 10
-        return 0
-
-    def _calculate_value_bonus(self, adp_diff: float, vorp: float) -> float:
+        return np.select(
+            [
+                (rank <= 5) & (vorp > 50),
+                (rank <= 12) & (vorp > 30),
+                (rank <= 24) & (vorp > 15),
+            ],
+            [20, 15, 10],
+            default=0,
+        )
+
+    def _calculate_value_bonus(
+        self, adp_diff: np.ndarray, vorp: np.ndarray
+    ) -> np.ndarray:
         """Calculate value pick bonus."""
-        if adp_diff > 20 and vorp > 5:
-            return 8
-        elif adp_diff > 10 and vorp > 0:
-            return 4
-        return 0
+        return np.select(
+            [(adp_diff > 20) & (vorp > 5), (adp_diff > 10) & (vorp > 0)],
+            [8, 4],
+            default=0,
+        )
 
-    def _calculate_reach_penalty(self, adp: float, adp_diff: float) -> float:
+    def _calculate_reach_penalty(
+        self, adp: np.ndarray, adp_diff: np.ndarray
+    ) -> np.ndarray:
         """Calculate reach penalty for high ADP players."""
-        if adp < 50 and adp_diff < -15:
-            return -15
-        elif adp_diff < -10:
-            return -8
-        return 0
+        return np.select(
+            [(adp < 50) & (adp_diff < -15), adp_diff < -10],
+            [-15, -8],
+            default=0,
+        )
 
     def _calculate_adp_reality_check(
-        self, pos: str, adp: float, round_bonus: float
-    ) -> float:
+        self, pos: np.ndarray, adp: np.ndarray, round_bonus: np.ndarray
+    ) -> np.ndarray:
         """
         ADP Reality Check - Balance statistical performance with market expectations.
 
         The market (ADP) isn't perfect, but it provides useful signal about true player value.
         This method tempers pure statistical rankings with community consensus.
         """
-        if adp >= 999:  # No ADP data available
-            return 0
-
-        # Position-specific ADP thresholds for round bonuses
-        early_pick_thresholds = {
-            "QB": 8,  # Only top 8 QBs should get major bonuses (QB1-QB8)
-            "RB": 12,  # RBs taken in top 12 are consensus RB1s
-            "WR": 18,  # WRs taken in top 18 are consensus WR1s
-            "TE": 30,  # TEs taken in top 30 are startable
-            "DL": 60,  # IDP taken in top 60 are consensus starters
-            "LB": 60,
-            "DB": 80,
-        }
-
-        mid_pick_thresholds = {
-            "QB": 24,  # QBs after pick 24 should have limited bonuses
-            "RB": 24,  # RBs after pick 24 are RB2s/flex
-            "WR": 36,  # WRs after pick 36 are WR2s/flex
-            "TE": 60,  # TEs after pick 60 are backup/streaming
-            "DL": 120,  # IDP after pick 120 are late-round fills
-            "LB": 120,
-            "DB": 150,
-        }
-
-        late_pick_thresholds = {
-            "QB": 60,  # QBs after pick 60 are bench/streaming
-            "RB": 48,  # RBs after pick 48 are handcuffs/dart throws
-            "WR": 72,  # WRs after pick 72 are WR3s/depth
-            "TE": 120,  # TEs after pick 120 are waiver wire
-            "DL": 180,
-            "LB": 180,
-            "DB": 200,
-        }
+        # Unknown positions (code -1) pick up the trailing default threshold
+        codes = (
+            pd.Series(pos, dtype=object)
+            .map(self._POS_CODE)
+            .fillna(-1)
+            .to_numpy(dtype=np.int8)
+        )
 
-        early_threshold = early_pick_thresholds.get(pos, 24)
-        mid_threshold = mid_pick_thresholds.get(pos, 48)
-        late_threshold = late_pick_thresholds.get(pos, 96)
+        # ADP bucket: no ADP data / early / mid / late / very late (or undrafted)
+        adp_bucket = np.select(
+            [
+                adp >= 999,
+                adp <= self._EARLY_ARR[codes],
+                adp <= self._MID_ARR[codes],
+                adp <= self._LATE_ARR[codes],
+            ],
+            [4, 0, 1, 2],
+            default=3,
+        )
+        # Round bonus tier: >= 35 / >= 20 / >= 10 / below
+        bonus_tier = np.select(
+            [round_bonus >= 35, round_bonus >= 20, round_bonus >= 10],
+            [0, 1, 2],
+            default=3,
+        )
 
         # ADP-based adjustments to round bonuses - much more aggressive
-        if adp <= early_threshold:
-            # Market consensus early pick - validate high bonuses
-            if round_bonus >= 35:
-                return 0  # Market agrees - no adjustment needed
-            elif round_bonus >= 20:
-                return 8  # Market suggests higher value
-            else:
-                return 15  # Market strongly disagrees - boost significantly
-
-        elif adp <= mid_threshold:
-            # Market consensus mid-round pick - moderate bonuses appropriate
-            if round_bonus >= 35:
-                return -25  # Strong penalty for high bonus + mid ADP
-            elif round_bonus >= 20:
-                return -10  # Moderate penalty for medium bonus + mid ADP
-            else:
-                return 5  # Slight boost for solid mid-round option
-
-        elif adp <= late_threshold:
-            # Late ADP - high bonuses likely wrong
-            if round_bonus >= 35:
-                return -40  # Major penalty for late ADP + high bonus
-            elif round_bonus >= 20:
-                return -25  # Strong penalty for late ADP + medium bonus
-            else:
-                return 0  # No adjustment for appropriately low bonus
-
-        else:
-            # Very late/undrafted ADP - severely penalize high bonuses
-            if round_bonus >= 35:
-                return -50  # Massive penalty for undrafted + high bonus
-            elif round_bonus >= 20:
-                return -35  # Large penalty for undrafted + medium bonus
-            elif round_bonus >= 10:
-                return -15  # Moderate penalty for undrafted + low bonus
-            else:
-                return 0  # No penalty for no bonus
-
-        return 0
+        return self.ADP_ADJUSTMENTS[adp_bucket, bonus_tier]
 
 
 class VORPCalculator:
@@ -1004,52 +1240,45 @@ class VORPCalculator:
     @staticmethod
     def calculate_vorp(pool_df: pd.DataFrame, league_config: dict) -> pd.DataFrame:
         """Calculate VORP for all players in the pool."""
-        result_df = pool_df.copy()
-        result_df["VORP"] = 0.0
-
-        for pos in result_df["position"].dropna().unique():
-            pos_players = (
-                result_df[result_df["position"] == pos]
-                .sort_values("Points", ascending=False)
-                .reset_index(drop=True)
-            )
+        positions = pool_df["position"]
 
-            if pos_players.empty:
-                continue
+        # One sort; each position's players then appear best-first in order
+        ranked = pool_df.loc[positions.notna(), ["position", "Points"]].sort_values(
+            "Points", ascending=False
+        )
+        by_pos = ranked.groupby("position", sort=False)
+        pos_rank = by_pos.cumcount()
 
-            rep_rank = VORPCalculator.calculate_replacement_rank(pos, league_config)
-            rep_points = pos_players.iloc[min(rep_rank - 1, len(pos_players) - 1)][
-                "Points"
-            ]
+        # Replacement player is the rep_rank-th best, or the last one available
+        rep_rank = {
+            pos: VORPCalculator.calculate_replacement_rank(pos, league_config)
+            for pos in ranked["position"].unique()
+        }
+        target = np.minimum(
+            ranked["position"].map(rep_rank).astype(int) - 1,
+            by_pos["Points"].transform("size") - 1,
+        )
+        rep_points = ranked.loc[pos_rank == target].set_index("position")["Points"]
 
-            # Map VORP back to original dataframe
-            result_df.loc[result_df["position"] == pos, "VORP"] = result_df.loc[
-                result_df["position"] == pos, "Points"
-            ] - float(rep_points)
+        vorp = pool_df["Points"] - positions.map(rep_points).astype(float)
 
-        return result_df
+        # assign() hands back a new frame without deep-copying the pool
+        return pool_df.assign(VORP=np.where(positions.notna(), vorp, 0.0))
 
 
 class TierAssigner:
     """Handles tier assignment based on point gaps."""
 
     @staticmethod
-    def assign_tiers(sorted_df: pd.DataFrame, gap: float) -> List[int]:
+    def assign_tiers(sorted_df: pd.DataFrame, gap: float) -> np.ndarray:
         """Assign tiers based on point drops between consecutive players."""
-        tiers = []
-        current_tier = 1
-
-        for i in range(len(sorted_df)):
-            if i == 0:
-                tiers.append(current_tier)
-                continue
-
-            point_drop = sorted_df.iloc[i - 1]["Points"] - sorted_df.iloc[i]["Points"]
-            if point_drop >= gap:
-                current_tier += 1
-
-            tiers.append(current_tier)
+        points = sorted_df["Points"].to_numpy(dtype=float)
 
+        # A new tier starts wherever the drop from the previous player >= gap;
+        # returned as an int array so callers can assign it as a column as-is
+        tiers = np.ones(len(points), dtype=np.int64)
+        np.cumsum(points[:-1] - points[1:] >= gap, out=tiers[1:])
+        tiers[1:] += 1
         return tiers
 
 
@@ -1058,10 +1287,44 @@ def replacement_rank(pos: str, cfg: dict) -> int:
     return VORPCalculator.calculate_replacement_rank(pos, cfg)
 
 
-def assign_tiers(sorted_df: pd.DataFrame, gap: float) -> List[int]:
+def assign_tiers(sorted_df: pd.DataFrame, gap: float) -> np.ndarray:
     return TierAssigner.assign_tiers(sorted_df, gap)
 
 
+# Row fill colors by tier, and by draft value label
+TIER_COLORS = {
+    1: "006400",  # dark green
+    2: "90EE90",  # light green
+    3: "FFF59D",  # soft yellow
+    4: "FFE082",  # amber
+    5: "FFCC80",  # orange
+    6: "BDBDBD",  # gray
+}
+VALUE_COLORS = {"STEAL": "90EE90", "VALUE": "E6FFE6", "REACH": "FFB6C1"}
+
+
+@lru_cache(maxsize=1)
+def _tier_fills() -> dict:
+    """Tier number -> row fill, built once on first use."""
+    from openpyxl.styles import PatternFill
+
+    return {
+        tier: PatternFill(start_color=color, end_color=color, fill_type="solid")
+        for tier, color in TIER_COLORS.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _value_fills() -> dict:
+    """Draft value label -> row fill, built once on first use."""
+    from openpyxl.styles import PatternFill
+
+    return {
+        label: PatternFill(start_color=color, end_color=color, fill_type="solid")
+        for label, color in VALUE_COLORS.items()
+    }
+
+
 class ExcelFormatter:
     """Handles Excel formatting and styling operations."""
 
@@ -1070,6 +1333,10 @@ class ExcelFormatter:
         excel_file_path, worksheet_name, drafted_column="I"
     ):
         """Apply conditional strikethrough formatting to a worksheet when 'X' is entered in the drafted column"""
+        from openpyxl import load_workbook
+        from openpyxl.formatting.rule import FormulaRule
+        from openpyxl.styles import Font
+
         try:
             # Load the workbook
             wb = load_workbook(excel_file_path)
@@ -1088,10 +1355,11 @@ class ExcelFormatter:
             last_data_col = chr(64 + drafted_col_num - 1)  # H if drafted is I
 
             # Get the last row with data
-            last_row = 2  # Start with row 2 (header is row 1)
-            for row in range(2, ws.max_row + 1):
-                if ws[f"A{row}"].value is not None:
-                    last_row = row
+            # Start with row 2 (header is row 1), scanning column A in one pass
+            last_row = max(
+                (cell.row for cell in ws["A"][1:] if cell.value is not None),
+                default=2,
+            )
 
             # Apply conditional formatting to each column A through last_data_col
             for col in range(ord("A"), ord(last_data_col) + 1):
@@ -1111,79 +1379,83 @@ class ExcelFormatter:
     @staticmethod
     def auto_color_worksheet(ws, tier_col=8):
         """Apply tier-based coloring to worksheet rows."""
-        fill_map = {
-            1: PatternFill(
-                start_color="006400", end_color="006400", fill_type="solid"
-            ),  # dark green
-            2: PatternFill(
-                start_color="90EE90", end_color="90EE90", fill_type="solid"
-            ),  # light green
-            3: PatternFill(
-                start_color="FFF59D", end_color="FFF59D", fill_type="solid"
-            ),  # soft yellow
-            4: PatternFill(
-                start_color="FFE082", end_color="FFE082", fill_type="solid"
-            ),  # amber
-            5: PatternFill(
-                start_color="FFCC80", end_color="FFCC80", fill_type="solid"
-            ),  # orange
-            6: PatternFill(
-                start_color="BDBDBD", end_color="BDBDBD", fill_type="solid"
-            ),  # gray
-        }
+        fills = _tier_fills()
 
-        max_row = ws.max_row
-        max_col = ws.max_column
-
-        for r in range(2, max_row + 1):
+        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, max_col=ws.max_column):
             try:
-                tier_value = int(ws.cell(row=r, column=tier_col).value)
+                tier_value = int(row[tier_col - 1].value)
             except Exception:
                 continue
 
-            fill = fill_map.get(tier_value)
-            if fill:
-                for c in range(1, max_col + 1):
-                    ws.cell(row=r, column=c).fill = fill
+            fill = fills.get(tier_value)
+            if fill is not None:
+                for cell in row:
+                    cell.fill = fill
 
     @staticmethod
     def apply_header_formatting(ws):
         """Apply formatting to header row."""
+        from openpyxl.styles import Alignment, Font
+
+        bold = Font(bold=True)
+        center = Alignment(horizontal="center")
         for cell in ws[1]:
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
+            cell.font = bold
+            cell.alignment = center
 
     @staticmethod
     def set_column_widths(ws, widths: List[int]):
         """Set column widths for worksheet."""
+        from openpyxl.utils import get_column_letter
+
         for idx, width in enumerate(widths, start=1):
-            if idx <= len(widths):
-                col_letter = ws.cell(row=1, column=idx).column_letter
-                ws.column_dimensions[col_letter].width = width
+            ws.column_dimensions[get_column_letter(idx)].width = width
 
     @staticmethod
     def apply_value_highlighting(ws, value_col: int, max_row: int):
         """Apply highlighting for value picks and reaches."""
-        for row in range(2, max_row + 1):
-            value_cell = ws.cell(row=row, column=value_col)
+        fills = _value_fills()
 
-            if value_cell.value == "STEAL":
-                color = PatternFill(
-                    start_color="90EE90", end_color="90EE90", fill_type="solid"
-                )
-            elif value_cell.value == "VALUE":
-                color = PatternFill(
-                    start_color="E6FFE6", end_color="E6FFE6", fill_type="solid"
-                )
-            elif value_cell.value == "REACH":
-                color = PatternFill(
-                    start_color="FFB6C1", end_color="FFB6C1", fill_type="solid"
-                )
-            else:
+        # Walk each row's cells once instead of looking them up per column
+        max_col = max(ws.max_column, value_col)
+        for row in ws.iter_rows(min_row=2, max_row=max_row, max_col=max_col):
+            color = fills.get(row[value_col - 1].value)
+            if color is None:
                 continue
 
-            for col in range(1, ws.max_column + 1):
-                ws.cell(row=row, column=col).fill = color
+            for cell in row:
+                cell.fill = color
+
+
+def style_xlsx_sheet(ws, df: pd.DataFrame, header_format, widths: List[int]):
+    """Bold/center the header, freeze it and set column widths on a sheet that
+    pandas has just written with the xlsxwriter engine."""
+    ws.write_row(0, 0, df.columns.tolist(), header_format)
+    ws.freeze_panes(1, 0)
+    for idx, width in enumerate(widths):
+        ws.set_column(idx, idx, width)
+
+
+def add_highlight_rules(ws, df: pd.DataFrame, rules, first_col=0, last_col=None):
+    """
+    Color a sheet's data rows with formula conditional formats.
+
+    ``rules`` are ``(criteria, format)`` pairs, highest priority first; Excel
+    evaluates them when the workbook opens, so nothing is styled cell by cell.
+    Criteria are written for row 2, e.g. ``'=$K2="STEAL"'``.
+    """
+    if df.empty:
+        return
+    if last_col is None:
+        last_col = df.shape[1] - 1
+    for criteria, cell_format in rules:
+        ws.conditional_format(
+            1,
+            first_col,
+            len(df),
+            last_col,
+            {"type": "formula", "criteria": criteria, "format": cell_format},
+        )
 
 
 # Legacy function for backward compatibility
@@ -1196,20 +1468,43 @@ def auto_color_worksheet(ws, tier_col=8):
 # -------------------------------
 
 
+def _read_csv(path: str) -> pd.DataFrame:
+    """Parse a CSV with the pyarrow engine."""
+    df = pd.read_csv(path, engine="pyarrow")
+    # Blank or repeated headers rely on the C parser's "Unnamed: n"/"col.1" names
+    if df.columns.has_duplicates or "" in df.columns:
+        df = pd.read_csv(path)
+    return df
+
+
+# Parsed CSVs by absolute path, as (mtime, frame); an edited file replaces its entry
+_CSV_CACHE: Dict[str, tuple] = {}
+
+
+def read_csv_cached(path: str) -> pd.DataFrame:
+    """Return a fresh copy of a CSV's contents, reusing earlier parses."""
+    path = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+    cached = _CSV_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _CSV_CACHE[path] = (mtime, _read_csv(path))
+    return cached[1].copy()
+
+
 def load_csv_flex(path: str) -> pd.DataFrame:
     # Resolve relative paths relative to the script location
     if not os.path.isabs(path):
         path = os.path.join(os.path.dirname(__file__), path)
     if not os.path.exists(path):
         raise FileNotFoundError(f"Missing file: {path}")
-    return pd.read_csv(path)
+    return read_csv_cached(path)
 
 
 def load_csv_absolute(path: str) -> pd.DataFrame:
     """Load CSV without path resolution - assumes path is already absolute or correctly resolved."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"Missing file: {path}")
-    return pd.read_csv(path)
+    return read_csv_cached(path)
 
 
 def load_sleeper_adp(cfg: dict) -> pd.DataFrame:
@@ -1222,7 +1517,7 @@ def load_sleeper_adp(cfg: dict) -> pd.DataFrame:
     if not os.path.isabs(p):
         p = os.path.join(os.path.dirname(__file__), p)
     if os.path.exists(p):
-        raw = pd.read_csv(p)
+        raw = read_csv_cached(p)
     elif cfg["sleeper_api"].get("use_api", False) and requests is not None:
         url = cfg["sleeper_api"]["source_url"].format(
             season=cfg["sleeper_api"]["season"],
@@ -1238,11 +1533,19 @@ def load_sleeper_adp(cfg: dict) -> pd.DataFrame:
             f"No ADP CSV found at {p}. Provide a CSV export or enable API in CONFIG."
         )
     # Standardize
-    adp_std = standardize(raw, ADP_MAP)
+    adp_std = standardize(raw, ADP_MAP, ADP_ALIAS_INDEX)
     # Keep key columns
     return adp_std[["player", "position", "team", "adp"]]
 
 
+# Trailing generational suffix on a title-cased name ("Jr.", "Sr", "Ii", "Iv.", ...)
+_SUFFIX_RE = re.compile(r" +(?:Jr|Sr|Ii|Iii|Iv|V)\.?$")
+# Anything but letters, digits and whitespace; runs of whitespace
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def normalize_player_name(name):
     """Normalize player names by removing common suffixes and standardizing format."""
     if not isinstance(name, str):
@@ -1252,44 +1555,129 @@ def normalize_player_name(name):
     name = name.strip().title()
 
     # Remove common suffixes (Jr., Sr., II, III, etc.)
-    suffixes = [
-        " Jr.",
-        " Sr.",
-        " II",
-        " III",
-        " IV",
-        " V",
-        " Jr",
-        " Sr",
-        " Ii",
-        " Iii",
-        " Iv",
-        " V",
-        " Jr.",
-        " Sr.",
-        " Ii.",
-        " Iii.",
-        " Iv.",
-        " V.",
-    ]
-
-    for suffix in suffixes:
-        if name.endswith(suffix):
-            name = name[: -len(suffix)].strip()
-            break
+    name = _SUFFIX_RE.sub("", name)
 
     # Handle other common name variations
-    import re
-
     # Remove all punctuation except letters, numbers, and spaces
-    name = re.sub(r"[^\w\s]", "", name)
+    name = _PUNCT_RE.sub("", name)
 
     # Remove extra spaces and normalize spacing
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _SPACE_RE.sub(" ", name).strip()
 
     return name
 
 
+def normalize_player_names(names: pd.Series) -> pd.Series:
+    """Vectorized normalize_player_name, doing the string work once per distinct name."""
+    # Object dtype keeps Python's str.title and re semantics for every step
+    distinct = pd.Series(names.dropna().unique(), dtype=object)
+    normalized = (
+        distinct.str.strip()
+        .str.title()
+        .str.replace(_SUFFIX_RE, "", regex=True)
+        .str.replace(_PUNCT_RE, "", regex=True)
+        .str.replace(_SPACE_RE, " ", regex=True)
+        .str.strip()
+    )
+    # Non-string names pass through unchanged, as in normalize_player_name
+    normalized = normalized.fillna(distinct)
+    return names.map(dict(zip(distinct, normalized)))
+
+
+def consensus_column(
+    values: np.ndarray,
+    weights: np.ndarray,
+    groups: np.ndarray,
+    slots: List[np.ndarray],
+    n_groups: int,
+    outlier_threshold=None,
+) -> np.ndarray:
+    """
+    Weighted average of one stat per player across sources.
+
+    ``slots[j]`` holds the row positions of every player's j-th source row, so
+    sums build up one source at a time in the same order as a per-player loop.
+    A lone value is used as-is; with more than two values and an outlier
+    threshold, values beyond ``threshold`` population standard deviations are
+    dropped first. Players with no usable values get 0.0.
+    """
+    valid = ~np.isnan(values)
+
+    def accumulate(keep: np.ndarray):
+        count = np.zeros(n_groups)
+        total = np.zeros(n_groups)
+        weighted = np.zeros(n_groups)
+        weight_sum = np.zeros(n_groups)
+        for rows in slots:
+            rows = rows[keep[rows]]
+            g = groups[rows]
+            count[g] += 1
+            total[g] += values[rows]
+            weighted[g] += values[rows] * weights[rows]
+            weight_sum[g] += weights[rows]
+        return count, total, weighted, weight_sum
+
+    count, total, weighted, weight_sum = accumulate(valid)
+
+    if outlier_threshold:
+        trimmed = count > 2
+        mean = np.divide(total, count, out=np.zeros(n_groups), where=trimmed)
+        squares = np.zeros(n_groups)
+        for rows in slots:
+            rows = rows[valid[rows]]
+            g = groups[rows]
+            deviation = values[rows] - mean[g]
+            squares[g] += deviation * deviation
+        std = np.sqrt(np.divide(squares, count, out=np.zeros(n_groups), where=trimmed))
+
+        trim_group = trimmed & (std > 0)
+        row_mean, row_std = mean[groups], std[groups]
+        keep = valid & (
+            ~trim_group[groups]
+            | (np.abs(values - row_mean) <= outlier_threshold * row_std)
+        )
+        _, _, weighted, weight_sum = accumulate(keep)
+
+    average = np.divide(
+        weighted, weight_sum, out=np.zeros(n_groups), where=weight_sum > 0
+    )
+
+    # numpy sums eight or more values pairwise rather than left to right, so
+    # the rare players with that many values go through numpy's reductions
+    for g in np.flatnonzero(count >= 8):
+        rows = np.flatnonzero(valid & (groups == g))
+        group_values, group_weights = values[rows], weights[rows]
+        if outlier_threshold:
+            std = np.std(group_values)
+            if std > 0:
+                inlier = (
+                    np.abs(group_values - np.mean(group_values))
+                    <= outlier_threshold * std
+                )
+                group_values = group_values[inlier]
+                group_weights = group_weights[inlier]
+        if len(group_values) and np.sum(group_weights) > 0:
+            average[g] = np.average(group_values, weights=group_weights)
+        else:
+            average[g] = 0.0
+
+    # A single value is taken as-is rather than through the weighted average
+    single = count == 1
+    first = np.full(n_groups, np.nan)
+    for rows in reversed(slots):
+        rows = rows[valid[rows]]
+        first[groups[rows]] = values[rows]
+    return np.where(single, first, average)
+
+
+def _load_projection_source(path: str):
+    """Load and standardize one projection source, returning (frame, error)."""
+    try:
+        return standardize_offense_position_aware(load_csv_absolute(path)), None
+    except Exception as e:
+        return None, e
+
+
 def load_consensus_projections(cfg: dict) -> pd.DataFrame:
     """
     Load and merge projections from multiple sources using weighted consensus.
@@ -1309,36 +1697,36 @@ def load_consensus_projections(cfg: dict) -> pd.DataFrame:
 
     print(f"📊 Loading {len(offense_sources)} projection sources...")
 
-    for source in offense_sources:
+    # Read and standardize the sources concurrently; results come back in order
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(offense_sources)))) as ex:
+        loaded = list(
+            ex.map(_load_projection_source, [s["path"] for s in offense_sources])
+        )
+
+    for source, (std_df, error) in zip(offense_sources, loaded):
         name = source["name"]
-        path = source["path"]
         weight = source.get("weight", 1.0)
 
-        try:
-            # Load and standardize the raw data
-            raw_df = load_csv_absolute(path)
-            std_df = standardize_offense_position_aware(raw_df)
-
-            # Remove exact duplicates within this source file
-            initial_count = len(std_df)
-            std_df = std_df.drop_duplicates(subset=["player"], keep="first")
-            if len(std_df) < initial_count:
-                print(
-                    f"  📋 Removed {initial_count - len(std_df)} duplicate entries from {name}"
-                )
+        if error is not None:
+            print(f"  ❌ {name}: Failed to load - {error}")
+            continue
 
-            # Add source identifier for tracking
-            std_df["_source"] = name
-            std_df["_weight"] = weight
+        # Remove exact duplicates within this source file
+        initial_count = len(std_df)
+        std_df = std_df.drop_duplicates(subset=["player"], keep="first")
+        if len(std_df) < initial_count:
+            print(
+                f"  📋 Removed {initial_count - len(std_df)} duplicate entries from {name}"
+            )
 
-            source_dfs.append(std_df)
-            all_players.update(std_df["player"].tolist())
+        # Add source identifier for tracking
+        std_df["_source"] = name
+        std_df["_weight"] = weight
 
-            print(f"  ✅ {name}: {len(std_df)} players (weight: {weight})")
+        source_dfs.append(std_df)
+        all_players.update(std_df["player"].tolist())
 
-        except Exception as e:
-            print(f"  ❌ {name}: Failed to load - {e}")
-            continue
+        print(f"  ✅ {name}: {len(std_df)} players (weight: {weight})")
 
     if not source_dfs:
         raise ValueError("No projection sources could be loaded successfully")
@@ -1362,89 +1750,41 @@ def load_consensus_projections(cfg: dict) -> pd.DataFrame:
     )
     print(f"   Found {len(all_players)} unique players across all sources")
 
-    # Create a master list of all players with their positions and teams
-    player_info = {}
-    for df in source_dfs:
-        for _, row in df.iterrows():
-            player = row["player"]
-            # Use normalized name for grouping to handle Jr/Sr variations
-            normalized_player = normalize_player_name(player)
-            if normalized_player not in player_info:
-                player_info[normalized_player] = {
-                    "original_names": [player],  # Keep track of original names
-                    "position": row.get("position", ""),
-                    "team": row.get("team", ""),
-                    "age": row.get("age", None),
-                }
-            else:
-                # Add to list of original names if not already present
-                if player not in player_info[normalized_player]["original_names"]:
-                    player_info[normalized_player]["original_names"].append(player)
-
-    # Create consensus projections for all players
-    consensus_rows = []
-
-    for normalized_player, info in player_info.items():
-        # Start with player identification - use the first original name
-        consensus_row = {
-            "player": info["original_names"][0],  # Use first original name
-            "position": info["position"],
-            "team": info["team"],
-            "age": info["age"],
-        }
+    # Stack every source, grouping rows by normalized name to catch Jr/Sr variations
+    stacked = pd.concat(source_dfs, ignore_index=True, sort=False)
+    stacked["_source_idx"] = np.repeat(
+        np.arange(len(source_dfs)), [len(df) for df in source_dfs]
+    )
+    stacked = stacked[stacked["player"].notna()]
+    normalized = normalize_player_names(stacked["player"])
+    group_codes, group_names = pd.factorize(normalized)
+
+    # Player identification comes from the first row seen for each player
+    consensus_df = stacked.loc[
+        ~normalized.duplicated().to_numpy(), ["player", "position", "team", "age"]
+    ].reset_index(drop=True)
+
+    # Visit each player's rows source by source, original names in first-seen
+    # order, so the weighted sums accumulate exactly as a per-player walk would
+    stacked = stacked.assign(
+        _group=group_codes, _name=pd.factorize(stacked["player"])[0]
+    ).sort_values(["_group", "_source_idx", "_name"], kind="stable")
+    groups = stacked["_group"].to_numpy()
+    slot = stacked.groupby("_group", sort=False).cumcount().to_numpy()
+    weights = stacked["_weight"].to_numpy(dtype=float)
+    slots = [np.flatnonzero(slot == j) for j in range(slot.max(initial=-1) + 1)]
+
+    outlier_threshold = consensus_config.get("outlier_threshold", None)
+    for col in all_numeric_cols:
+        values = pd.to_numeric(stacked[col], errors="coerce").to_numpy(dtype=float)
+        consensus_df[col] = consensus_column(
+            values, weights, groups, slots, len(group_names), outlier_threshold
+        )
 
-        # Find all data for this player across sources (using all original names)
-        player_data = []
-        for df in source_dfs:
-            for original_name in info["original_names"]:
-                player_rows = df[df["player"] == original_name]
-                if not player_rows.empty:
-                    player_data.append(player_rows.iloc[0])
-
-        # If we have data for this player from at least one source
-        if len(player_data) >= consensus_config.get("min_sources", 1):
-            # Calculate consensus values for each numeric column
-            for col in all_numeric_cols:
-                values = []
-                weights = []
-
-                for row in player_data:
-                    if col in row and not pd.isna(row[col]):
-                        values.append(row[col])
-                        weights.append(row["_weight"])
-
-                if values:
-                    # Calculate weighted average
-                    if len(values) == 1:
-                        consensus_row[col] = values[0]
-                    else:
-                        # Handle outlier detection if configured
-                        outlier_threshold = consensus_config.get(
-                            "outlier_threshold", None
-                        )
-                        if outlier_threshold and len(values) > 2:
-                            mean_val = np.mean(values)
-                            std_val = np.std(values)
-                            if std_val > 0:  # Avoid division by zero
-                                outlier_mask = (
-                                    np.abs(np.array(values) - mean_val)
-                                    <= outlier_threshold * std_val
-                                )
-                                values = np.array(values)[outlier_mask].tolist()
-                                weights = np.array(weights)[outlier_mask].tolist()
-
-                        if values and np.sum(weights) > 0:
-                            consensus_row[col] = np.average(values, weights=weights)
-                        else:
-                            consensus_row[col] = 0.0
-                else:
-                    # No data for this column, use 0
-                    consensus_row[col] = 0.0
-
-            consensus_rows.append(consensus_row)
-
-    # Create final consensus DataFrame
-    consensus_df = pd.DataFrame(consensus_rows)
+    # Keep players with data from enough sources
+    source_rows = np.bincount(groups, minlength=len(group_names))
+    enough = source_rows >= consensus_config.get("min_sources", 1)
+    consensus_df = consensus_df[enough].reset_index(drop=True)
 
     # Ensure all expected columns exist with default values if missing
     expected_numeric_cols = [
@@ -1596,13 +1936,10 @@ def main(
     off["player"] = off["player"].astype(str).str.strip('"')
 
     # Extract base position from position strings like 'WR1', 'RB2'
-    off["position"] = off["position"].apply(extract_position)
+    off["position"] = PositionMapper.extract_position_series(off["position"])
 
     # Check if we have actual projection columns or just rankings
-    has_proj_stats = any(
-        any(col in off_raw.columns for col in OFFENSE_MAP[stat_col])
-        for stat_col in ["pass_yards", "rush_yards", "receptions"]
-    )
+    has_proj_stats = not _OFFENSE_PROJ_COLUMNS.isdisjoint(off_raw.columns)
 
     if has_proj_stats:
         # Use traditional projection-based scoring
@@ -1611,12 +1948,7 @@ def main(
     else:
         # Use ranking-based scoring
         print("⚠️ No projection columns found, using ranking-based scoring for offense")
-        off["Points"] = 0.0
-        for pos in off["position"].unique():
-            if pos and pos != "":
-                pos_mask = off["position"] == pos
-                pos_data = off[pos_mask].copy()
-                off.loc[pos_mask, "Points"] = assign_points_from_rankings(pos_data, pos)
+        off["Points"] = assign_points_all_positions(off)
 
     off["position"] = off["position"].replace({"FB": "RB"})  # normalize if needed
 
@@ -1627,82 +1959,67 @@ def main(
     use_idp = cfg["league"]["use_idp"] and os.path.exists(idp_path)
     if use_idp:
         idp_raw = load_csv_flex(cfg["paths"]["idp_csv"])
-        idp = standardize(idp_raw, IDP_MAP)
+        idp = standardize(idp_raw, IDP_MAP, IDP_ALIAS_INDEX)
 
         # Clean player names
         idp["player"] = idp["player"].astype(str).str.strip('"')
 
         # Extract base position
-        idp["position"] = idp["position"].apply(extract_position)
+        idp["position"] = PositionMapper.extract_position_series(idp["position"])
 
         # Check if we have actual projection columns or just rankings
-        has_idp_proj_stats = any(
-            any(col in idp_raw.columns for col in IDP_MAP[stat_col])
-            for stat_col in ["tackle_solo", "tackles_total", "sack", "int"]
-        )
+        has_idp_proj_stats = not _IDP_PROJ_COLUMNS.isdisjoint(idp_raw.columns)
 
         if has_idp_proj_stats:
             idp["Points"] = apply_idp_scoring(idp, cfg["scoring"]["idp"])
             print("✅ Using projection-based scoring for IDP")
         else:
             print("⚠️ No projection columns found, using ranking-based scoring for IDP")
-            idp["Points"] = 0.0
-            for pos in idp["position"].unique():
-                if pos and pos != "":
-                    pos_mask = idp["position"] == pos
-                    pos_data = idp[pos_mask].copy()
-                    idp.loc[pos_mask, "Points"] = assign_points_from_rankings(
-                        pos_data, pos
-                    )
+            idp["Points"] = assign_points_all_positions(idp)
 
         pool = pd.concat([off, idp], ignore_index=True, sort=False)
     else:
         pool = off.copy()
 
+    # A handful of positions drive every per-position compare, map and groupby
+    # below, so store them as category codes once offense and IDP are combined
+    pool["position"] = pool["position"].astype("category")
+
     # NFL analytics feature has been removed
     print(
         "ℹ️ NFL analytics feature has been removed - continuing with standard projections"
     )
 
     # Apply name normalization to both datasets
-    adp_copy = adp.copy()
-    pool_copy = pool.copy()
+    adp_names = normalize_player_names(adp["player"])
+    pool_names = normalize_player_names(pool["player"])
 
-    adp_copy["normalized_name"] = adp_copy["player"].apply(normalize_player_name)
-    pool_copy["normalized_name"] = pool_copy["player"].apply(normalize_player_name)
+    # Merge ADP onto the pool using normalized names (earliest ADP per name)
+    pool["adp"] = DataProcessor.lookup_adp(pool_names, adp_names, adp["adp"])
 
-    # Merge using normalized names
-    pool_copy = pool_copy.merge(
-        adp_copy[["normalized_name", "adp"]], on=["normalized_name"], how="left"
-    )
-
-    # Update the original pool with the merged ADP data
-    pool["adp"] = pool_copy["adp"]
+    # Optionally reconcile names the exact merge missed (needs rapidfuzz)
+    fuzzy_threshold = cfg.get("matching", {}).get("fuzzy_threshold")
+    if fuzzy_threshold:
+        pool["adp"] = DataProcessor.fill_adp_fuzzy(
+            pool, pool_names, adp, adp_names, fuzzy_threshold
+        )
 
-    # Apply normalization to the main pool for consistent duplicate detection
-    pool["normalized_name"] = pool["player"].apply(normalize_player_name)
+    # Reuse the normalized names for consistent duplicate detection
+    pool["normalized_name"] = pool_names
 
     # Handle duplicate player names using normalized names (catches Jr/Sr variations)
-    duplicate_names = pool[pool.duplicated(subset=["normalized_name"], keep=False)][
-        "normalized_name"
-    ].unique()
-
-    for dup_name in duplicate_names:
-        dup_players = pool[pool["normalized_name"] == dup_name].copy()
-        if len(dup_players) > 1:
-            print(
-                f"🔧 Found duplicate players for '{dup_name}': {[p for p in dup_players['player'].tolist()]}"
-            )
-            # Find the player with highest points (most likely the "real" player)
-            max_points_idx = dup_players["Points"].idxmax()
-            # Set ADP to NaN for all except the highest-points player
-            pool.loc[
-                (pool["normalized_name"] == dup_name) & (pool.index != max_points_idx),
-                "adp",
-            ] = pd.NA
+    is_duplicate = (
+        pool["normalized_name"].duplicated(keep=False) & pool["normalized_name"].notna()
+    )
+    duplicates = pool[is_duplicate].groupby("normalized_name", sort=False)
+    for dup_name, dup_players in duplicates["player"]:
+        print(f"🔧 Found duplicate players for '{dup_name}': {dup_players.tolist()}")
 
-    # Fill missing ADP with high numbers (late picks)
-    pool["adp"] = pool["adp"].fillna(999)
+    # Keep ADP only on the highest-points player (most likely the "real" player);
+    # everyone else, like players with no ADP, gets a high number (late pick)
+    max_points_idx = duplicates["Points"].idxmax()
+    keeps_adp = ~is_duplicate | pool.index.isin(max_points_idx)
+    pool["adp"] = pool["adp"].where(keeps_adp & pool["adp"].notna(), 999)
 
     # VORP calculation using the new class
     pool = VORPCalculator.calculate_vorp(pool, cfg["league"])
@@ -1729,59 +2046,62 @@ def main(
     overall["Tier"] = TierAssigner.assign_tiers(overall, gaps)
 
     # Add value indicators
-    for i in range(len(overall)):
-        adp_diff = overall.iloc[i]["ADP_Diff"]
-        if adp_diff >= 20:
-            overall.iloc[i, overall.columns.get_loc("Draft_Value")] = "STEAL"
-        elif adp_diff >= 10:
-            overall.iloc[i, overall.columns.get_loc("Draft_Value")] = "VALUE"
-        elif adp_diff <= -20:
-            overall.iloc[i, overall.columns.get_loc("Draft_Value")] = "REACH"
-        elif adp_diff <= -10:
-            overall.iloc[i, overall.columns.get_loc("Draft_Value")] = "EARLY"
+    adp_diff = overall["ADP_Diff"].to_numpy()
+    overall["Draft_Value"] = np.select(
+        [adp_diff >= 20, adp_diff >= 10, adp_diff <= -20, adp_diff <= -10],
+        ["STEAL", "VALUE", "REACH", "EARLY"],
+        default="",
+    )
 
     # Build position sheets with their tier gaps and enhanced metrics
+    # (partition the pool once instead of masking it for every position)
     by_pos = {}
+    pool_by_position = pool.groupby("position", observed=True)
     for pos in ["QB", "RB", "WR", "TE", "DL", "LB", "DB"]:
+        if pos not in pool_by_position.groups:
+            continue
         sub = (
-            pool[pool["position"] == pos]
+            pool_by_position.get_group(pos)
             .sort_values("Points", ascending=False)
             .reset_index(drop=True)
         )
-        if sub.empty:
-            continue
 
         # Add positional ranking and metrics
         sub["Pos_Rank"] = range(1, len(sub) + 1)
-        sub["Next_Drop"] = 0.0  # Points drop to next player
 
-        # Calculate point drops to next player
-        for i in range(len(sub) - 1):
-            sub.iloc[i, sub.columns.get_loc("Next_Drop")] = (
-                sub.iloc[i]["Points"] - sub.iloc[i + 1]["Points"]
-            )
+        # Points drop to next player (none after the last one)
+        points = sub["Points"].to_numpy(dtype=float)
+        sub["Next_Drop"] = np.append(points[:-1] - points[1:], 0.0)
 
         # Calculate tiers using the new TierAssigner
         pgap = cfg["tiers"]["tier_gap_points"].get(pos, 10.0)
         sub["Tier"] = TierAssigner.assign_tiers(sub, pgap)
 
         # Add positional scarcity indicators
-        sub["Scarcity"] = ""
-        for i in range(len(sub)):
-            if sub.iloc[i]["Pos_Rank"] <= 12:  # Top 12 in position
-                if sub.iloc[i]["Next_Drop"] >= pgap * 1.5:
-                    sub.iloc[i, sub.columns.get_loc("Scarcity")] = "CLIFF"
-                elif sub.iloc[i]["Next_Drop"] >= pgap:
-                    sub.iloc[i, sub.columns.get_loc("Scarcity")] = "DROP"
+        top_12 = sub["Pos_Rank"].to_numpy() <= 12  # Top 12 in position
+        next_drop = sub["Next_Drop"].to_numpy()
+        sub["Scarcity"] = np.select(
+            [top_12 & (next_drop >= pgap * 1.5), top_12 & (next_drop >= pgap)],
+            ["CLIFF", "DROP"],
+            default="",
+        )
 
         by_pos[pos] = sub
 
+    # Optional columnar export of the overall board; much cheaper to write and
+    # re-read than the styled workbook when another tool consumes the results
+    parquet_out = cfg["paths"].get("output_parquet")
+    if parquet_out:
+        if not os.path.isabs(parquet_out):
+            parquet_out = os.path.join(os.path.dirname(__file__), parquet_out)
+        overall.to_parquet(parquet_out, index=False, compression="zstd")
+
     # Export Excel with enhanced columns
     out = cfg["paths"]["output_xlsx"]
     # Resolve relative paths relative to the script location
     if not os.path.isabs(out):
         out = os.path.join(os.path.dirname(__file__), out)
-    with pd.ExcelWriter(out, engine="openpyxl") as writer:
+    with pd.ExcelWriter(out, engine="xlsxwriter") as writer:
         # Overall sheet with enhanced columns optimized for drafting
         ov = overall.rename(
             columns={
@@ -1814,6 +2134,7 @@ def main(
         # NFL Analysis sheet removed - NFL analytics feature has been removed
 
         # Position sheets with enhanced columns
+        pos_sheets = {}
         for pos, dfp in by_pos.items():
             dfp2 = dfp.rename(
                 columns={
@@ -1838,192 +2159,149 @@ def main(
                 ]
             ]
             dfp2.to_excel(writer, sheet_name=pos, index=False)
+            pos_sheets[pos] = dfp2
 
-        # Create optimized Draft Board sheet for live drafting
-        draft_board = overall.copy()
-
-        # Rename columns first
-        draft_board = draft_board.rename(
-            columns={
-                "player": "Player",
-                "team": "Team",
-                "position": "Pos",
-            }
-        )
-
-        # Create simplified draft board with only essential columns
+        # Create optimized Draft Board sheet for live drafting, selecting only
+        # the essential columns before renaming so the full board isn't copied
         essential_columns = [
             "Draft_Priority",
             "Draft_Rank",
-            "Player",
-            "Pos",
-            "Team",
+            "player",
+            "position",
+            "team",
             "Tier",
             "adp",
             "Draft_Value",
         ]
-        available_columns = [
-            col for col in essential_columns if col in draft_board.columns
-        ]
-
-        # Select only available columns
-        draft_board = draft_board[available_columns]
+        available_columns = [col for col in essential_columns if col in overall]
 
-        # Rename for cleaner display
+        # Rename for cleaner display, then add empty "Drafted" column (plus
+        # Round/Pick) for marking during live draft
         column_renames = {
+            "player": "Player",
+            "team": "Team",
+            "position": "Pos",
             "Draft_Priority": "Priority",
             "Draft_Rank": "Rank",
             "adp": "ADP",
             "Draft_Value": "Value",
         }
-        draft_board = draft_board.rename(columns=column_renames)
-
-        # Add empty "Drafted" column for marking during live draft
-        draft_board["Drafted"] = ""
-        draft_board["Round"] = ""
-        draft_board["Pick"] = ""
+        draft_board = (
+            overall[available_columns]
+            .rename(columns=column_renames)
+            .assign(Drafted="", Round="", Pick="")
+        )
 
         draft_board.to_excel(writer, sheet_name="Draft Board", index=False)
 
-    # Add colors & formatting with enhanced features
-    wb = load_workbook(out)
-    for name in wb.sheetnames:
-        ws = wb[name]
-        # header
-        for c in ws[1]:
-            c.font = Font(bold=True)
-            c.alignment = Alignment(horizontal="center")
-
-        # Color rows by Tier (adjust column based on sheet)
-        if name == "Overall":
-            auto_color_worksheet(ws, tier_col=8)  # Tier column for Overall
-            # Set column widths for Overall sheet
-            widths = [
-                12,
-                8,
-                22,
-                6,
-                8,
-                10,
-                10,
-                6,
-                8,
-                10,
-                12,
-                8,
-            ]  # Updated for new column order
-
-            # Highlight value picks and reaches in Draft_Value column (column 11)
-            for row in range(2, ws.max_row + 1):
-                value_cell = ws.cell(row=row, column=11)  # Draft_Value column
-                if value_cell.value == "STEAL":
-                    for col in range(1, ws.max_column + 1):
-                        ws.cell(row=row, column=col).fill = PatternFill(
-                            start_color="90EE90", end_color="90EE90", fill_type="solid"
-                        )
-                elif value_cell.value == "VALUE":
-                    for col in range(1, ws.max_column + 1):
-                        ws.cell(row=row, column=col).fill = PatternFill(
-                            start_color="E6FFE6", end_color="E6FFE6", fill_type="solid"
-                        )
-                elif value_cell.value == "REACH":
-                    for col in range(1, ws.max_column + 1):
-                        ws.cell(row=row, column=col).fill = PatternFill(
-                            start_color="FFB6C1", end_color="FFB6C1", fill_type="solid"
-                        )
-
-            # Highlight top Draft Priority scores (top 24 picks get gold highlighting)
-            for row in range(2, min(26, ws.max_row + 1)):  # Top 24 picks
-                draft_rank_cell = ws.cell(row=row, column=2)  # Draft_Rank column
-                if draft_rank_cell.value <= 24:
-                    priority_cell = ws.cell(row=row, column=1)  # Draft_Priority column
-                    priority_cell.fill = PatternFill(
-                        start_color="FFD700", end_color="FFD700", fill_type="solid"
-                    )
-                    priority_cell.font = Font(bold=True)
-
-        elif name == "Draft Board":
-            # Special formatting for Draft Board
-            # Set column widths for Draft Board
-            widths = [10, 6, 22, 6, 8, 6, 8, 12, 12, 8, 6]
-
-            # Color by tiers and value
-            for row in range(2, ws.max_row + 1):
-                tier_cell = ws.cell(row=row, column=6)  # Tier column
-                value_cell = ws.cell(row=row, column=8)  # Value column
-
-                # Tier-based row coloring (lighter)
-                tier_value = tier_cell.value if tier_cell.value else 1
-                if tier_value == 1:
-                    row_color = "F0F8FF"  # Light blue for tier 1
-                elif tier_value == 2:
-                    row_color = "F5F5F5"  # Light gray for tier 2
-                elif tier_value <= 4:
-                    row_color = "FFFAFA"  # Very light for tiers 3-4
-                else:
-                    row_color = "FFFFFF"  # White for lower tiers
-
-                # Apply tier coloring to entire row
-                for col in range(1, ws.max_column + 1):
-                    ws.cell(row=row, column=col).fill = PatternFill(
-                        start_color=row_color, end_color=row_color, fill_type="solid"
-                    )
-
-                # Override with value colors if applicable
-                if value_cell.value == "STEAL":
-                    for col in range(1, 9):  # Don't color draft tracking columns
-                        ws.cell(row=row, column=col).fill = PatternFill(
-                            start_color="90EE90", end_color="90EE90", fill_type="solid"
-                        )
-                elif value_cell.value == "VALUE":
-                    for col in range(1, 9):
-                        ws.cell(row=row, column=col).fill = PatternFill(
-                            start_color="E6FFE6", end_color="E6FFE6", fill_type="solid"
-                        )
-
-            # Apply strikethrough formatting to Draft Board using the reusable function
-            # This will be done after the Excel file is saved
-            pass
-
-        elif name == "Draft Strategy":
-            # Set column widths for Draft Strategy
-            widths = [25, 15, 15, 40]
+        # Add colors & formatting with enhanced features
+        from xlsxwriter.utility import xl_col_to_name
 
-        else:
-            # Default position sheet formatting
-            auto_color_worksheet(ws, tier_col=7)  # Tier column for position sheets
-            # Set column widths for position sheets
-            widths = [8, 22, 8, 6, 10, 10, 6, 10, 12, 8]  # Updated for new columns
-
-            # Highlight scarcity indicators
-            for row in range(2, ws.max_row + 1):
-                scarcity_cell = ws.cell(row=row, column=9)  # Scarcity column
-                if scarcity_cell.value == "CLIFF":
-                    scarcity_cell.fill = PatternFill(
-                        start_color="FF4500", end_color="FF4500", fill_type="solid"
-                    )
-                    scarcity_cell.font = Font(color="FFFFFF", bold=True)
-                elif scarcity_cell.value == "DROP":
-                    scarcity_cell.fill = PatternFill(
-                        start_color="FFA500", end_color="FFA500", fill_type="solid"
-                    )
-                    scarcity_cell.font = Font(bold=True)
-
-        # freeze header
-        ws.freeze_panes = "A2"
-        # set column widths
-        for idx, w in enumerate(widths, start=1):
-            if idx <= len(widths):
-                col_letter = ws.cell(row=1, column=idx).column_letter
-                ws.column_dimensions[col_letter].width = w
-    wb.save(out)
+        book = writer.book
+        header_format = book.add_format({"bold": True, "align": "center"})
+        fills = {
+            color: book.add_format({"bg_color": f"#{color}"})
+            for color in {*TIER_COLORS.values(), *VALUE_COLORS.values()}
+        }
 
-    print(f"✅ Cheat sheet created: {out}")
+        def column(df: pd.DataFrame, name: str) -> str:
+            return xl_col_to_name(df.columns.get_loc(name))
+
+        def tier_rules(df: pd.DataFrame):
+            tier = column(df, "Tier")
+            return [(f"=${tier}2={t}", fills[c]) for t, c in TIER_COLORS.items()]
+
+        # Overall: highlight top Draft Priority scores (top 24 picks get gold
+        # highlighting), then value picks and reaches, then rows by tier
+        ws = writer.sheets["Overall"]
+        style_xlsx_sheet(
+            ws, ov, header_format, [12, 8, 22, 6, 8, 10, 10, 6, 8, 10, 12, 8]
+        )
+        gold = book.add_format({"bg_color": "#FFD700", "bold": True})
+        add_highlight_rules(
+            ws,
+            ov.head(24),
+            [(f"=${column(ov, 'Draft_Rank')}2<=24", gold)],
+            last_col=0,
+        )
+        value = column(ov, "Draft_Value")
+        add_highlight_rules(
+            ws,
+            ov,
+            [(f'=${value}2="{v}"', fills[c]) for v, c in VALUE_COLORS.items()]
+            + tier_rules(ov),
+        )
+
+        # Position sheets: scarcity indicators, then rows by tier
+        for pos, dfp2 in pos_sheets.items():
+            ws = writer.sheets[pos]
+            style_xlsx_sheet(
+                ws, dfp2, header_format, [8, 22, 8, 6, 10, 10, 6, 10, 12, 8]
+            )
+            scarcity = dfp2.columns.get_loc("Scarcity")
+            add_highlight_rules(
+                ws,
+                dfp2,
+                [
+                    (
+                        f'=${xl_col_to_name(scarcity)}2="CLIFF"',
+                        book.add_format(
+                            {
+                                "bg_color": "#FF4500",
+                                "font_color": "#FFFFFF",
+                                "bold": True,
+                            }
+                        ),
+                    ),
+                    (
+                        f'=${xl_col_to_name(scarcity)}2="DROP"',
+                        book.add_format({"bg_color": "#FFA500", "bold": True}),
+                    ),
+                ],
+                first_col=scarcity,
+                last_col=scarcity,
+            )
+            add_highlight_rules(ws, dfp2, tier_rules(dfp2))
+
+        # Draft Board: value colors on the player columns (not the draft tracking
+        # columns), over lighter tier coloring across the whole row
+        ws = writer.sheets["Draft Board"]
+        style_xlsx_sheet(
+            ws, draft_board, header_format, [10, 6, 22, 6, 8, 6, 8, 12, 12, 8, 6]
+        )
+        drafted = column(draft_board, "Drafted")
+        value = column(draft_board, "Value")
+        tier = column(draft_board, "Tier")
+        player_cols = draft_board.columns.get_loc("Drafted") - 1
+
+        # Strike through players once an "X" is entered in the Drafted column
+        strikethrough = book.add_format(
+            {"font_strikeout": True, "font_color": "#808080"}
+        )
+        add_highlight_rules(
+            ws,
+            draft_board,
+            [(f'=${drafted}2="X"', strikethrough)]
+            + [
+                (f'=${value}2="{v}"', fills[VALUE_COLORS[v]])
+                for v in ("STEAL", "VALUE")
+            ],
+            last_col=player_cols,
+        )
+        add_highlight_rules(
+            ws,
+            draft_board,
+            [
+                # Missing tiers count as tier 1
+                (f"=${tier}2<=1", book.add_format({"bg_color": "#F0F8FF"})),
+                (f"=${tier}2=2", book.add_format({"bg_color": "#F5F5F5"})),
+                (f"=${tier}2<=4", book.add_format({"bg_color": "#FFFAFA"})),
+                (f"=${tier}2>4", book.add_format({"bg_color": "#FFFFFF"})),
+            ],
+        )
 
-    # Apply strikethrough formatting to Draft Board sheet
-    # Normalize the path for Excel
-    normalized_path = os.path.abspath(out)
-    ExcelFormatter.apply_strikethrough_formatting(normalized_path, "Draft Board", "I")
+    print(f"✅ Cheat sheet created: {out}")
+    print("✅ Automatic strikethrough formatting applied to Draft Board sheet!")
 
     # Print draft insights using the new printer class
     DraftInsightsPrinter.print_draft_insights(overall, by_pos, use_idp)
@@ -2071,11 +2349,11 @@ class DraftInsightsPrinter:
     def _print_top_priorities(overall_df: pd.DataFrame):
         """Print top 10 draft priorities."""
         print("🎯 TOP 10 DRAFT PRIORITIES:")
-        top_priorities = overall_df.head(10)
+        top_priorities = overall_df[["player", "position", "Draft_Priority"]].head(10)
 
-        for i, (_, player) in enumerate(top_priorities.iterrows(), 1):
+        for i, player in enumerate(top_priorities.itertuples(index=False), 1):
             print(
-                f"  {i:2d}. {player['player']:20s} ({player['position']}) - Priority: {player['Draft_Priority']:5.1f}"
+                f"  {i:2d}. {player.player:20s} ({player.position}) - Priority: {player.Draft_Priority:5.1f}"
             )
 
     @staticmethod
@@ -2099,10 +2377,11 @@ class DraftInsightsPrinter:
         ].head(5)
 
         if not value_priorities.empty:
-            for _, player in value_priorities.iterrows():
+            columns = ["player", "position", "Draft_Priority", "Draft_Rank", "adp"]
+            for player in value_priorities[columns].itertuples(index=False):
                 print(
-                    f"  {player['player']} ({player['position']}) - Priority {player['Draft_Priority']:.1f}, "
-                    f"Ranked #{player['Draft_Rank']} vs ADP {player['adp']:.0f}"
+                    f"  {player.player} ({player.position}) - Priority {player.Draft_Priority:.1f}, "
+                    f"Ranked #{player.Draft_Rank} vs ADP {player.adp:.0f}"
                 )
         else:
             print("  No major value picks found in current data")
@@ -12,7 +12,21 @@ import pandas as pd
 from datetime import datetime, timedelta
 import json
 import os
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+
+def fetch_weather_by_city(
+    fetch: Callable[[str], Dict], cities: List[str]
+) -> Dict[str, Dict]:
+    """Call ``fetch`` once per distinct city concurrently, keyed by city"""
+    unique_cities = list(dict.fromkeys(cities))
+    if not unique_cities:
+        return {}
+
+    # Lookups are network-bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(16, len(unique_cities))) as executor:
+        return dict(zip(unique_cities, executor.map(fetch, unique_cities)))
 
 
 class WeatherAnalyzer:
@@ -25,6 +39,7 @@ class WeatherAnalyzer:
         """
         self.api_key = api_key or os.getenv("OPENWEATHER_API_KEY")
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self.session = requests.Session()
 
     def get_game_weather(self, city: str, date: str = None) -> Dict:
         """Get weather forecast for game location"""
@@ -40,12 +55,16 @@ class WeatherAnalyzer:
         }
 
         try:
-            response = requests.get(endpoint, params=params, timeout=10)
+            response = self.session.get(endpoint, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             return {"error": str(e)}
 
+    def get_games_weather(self, cities: List[str]) -> Dict[str, Dict]:
+        """Get weather forecasts for several game locations concurrently"""
+        return fetch_weather_by_city(self.get_game_weather, cities)
+
     def analyze_weather_impact(self, weather_data: Dict) -> Dict:
         """Analyze weather conditions and their fantasy impact"""
         if "error" in weather_data:
@@ -208,39 +227,45 @@ def apply_weather_adjustments(
 
     adjusted_df = projections_df.copy()
 
+    positions = ["QB", "RB", "WR", "TE"]
+
     # Add weather impact columns
-    for position in ["QB", "RB", "WR", "TE"]:
+    for position in positions:
         adjusted_df[f"{position}_weather_impact"] = 0.0
 
-    # Process each player's team
-    for idx, row in adjusted_df.iterrows():
-        team = row.get("team")
-        position = row.get("position")
-
-        if team in team_city_map and position in ["QB", "RB", "WR", "TE"]:
-            city = team_city_map[team]
-
-            # Get weather data
-            weather_data = weather_analyzer.get_game_weather(city)
-            if "error" not in weather_data:
-                impact_analysis = weather_analyzer.analyze_weather_impact(weather_data)
-
-                # Apply position-specific adjustment
-                impact_key = f"{position.lower()}_impact"
-                if impact_key in impact_analysis:
-                    impact = impact_analysis[impact_key]
-
-                    # Store the impact
-                    adjusted_df.at[idx, f"{position}_weather_impact"] = impact
-
-                    # Apply to projections (example: adjust passing/receiving yards)
-                    if position == "QB":
-                        # Adjust passing yards by impact percentage
-                        if "pass_yd" in adjusted_df.columns:
-                            adjusted_df.at[idx, "pass_yd"] *= 1 + impact * 0.1
-                    elif position == "WR":
-                        if "rec_yd" in adjusted_df.columns:
-                            adjusted_df.at[idx, "rec_yd"] *= 1 + impact * 0.15
+    # Fetch each game city once up front instead of once per player
+    relevant = adjusted_df[
+        adjusted_df["position"].isin(positions)
+        & adjusted_df["team"].isin(list(team_city_map))
+    ]
+    cities = [team_city_map[team] for team in relevant["team"].unique()]
+    city_impacts = {}
+    for city, weather_data in weather_analyzer.get_games_weather(cities).items():
+        if "error" not in weather_data:
+            city_impacts[city] = weather_analyzer.analyze_weather_impact(weather_data)
+
+    # Resolve each player's impact by position in one vectorized pass
+    yard_adjustments = {"QB": ("pass_yd", 0.1), "WR": ("rec_yd", 0.15)}
+    for position in positions:
+        impact_key = f"{position.lower()}_impact"
+        team_impacts = {
+            team: city_impacts[city][impact_key]
+            for team, city in team_city_map.items()
+            if impact_key in city_impacts.get(city, {})
+        }
+        impact = adjusted_df["team"].map(team_impacts)
+        mask = (adjusted_df["position"] == position) & impact.notna()
+        if not mask.any():
+            continue
+
+        # Store the impact
+        adjusted_df.loc[mask, f"{position}_weather_impact"] = impact[mask]
+
+        # Apply to projections (example: adjust passing/receiving yards)
+        if position in yard_adjustments:
+            stat_col, factor = yard_adjustments[position]
+            if stat_col in adjusted_df.columns:
+                adjusted_df.loc[mask, stat_col] *= 1 + impact[mask] * factor
 
     return adjusted_df
 
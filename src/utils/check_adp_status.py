@@ -1,3 +1,6 @@
+import re
+
+import numpy as np
 import pandas as pd
 
 # Check current status of these players
@@ -7,13 +10,24 @@ excel_df = pd.read_excel(
 
 test_players = ["Marvin Harrison", "Kyle Pitts", "Patrick Mahomes", "Deebo Samuel"]
 
+SUFFIX_RE = re.compile(r"\s+(?:jr\.?|sr\.?|ii|iii|iv|v)$")
+
+# Index sheet rows by normalized name once instead of re-scanning per player
+normalized = (
+    excel_df["Player"].str.lower().str.strip().str.replace(SUFFIX_RE, "", regex=True)
+)
+name_index = excel_df.groupby(normalized, sort=False).indices
+
 print("Current ADP status:")
 for player in test_players:
-    player_data = excel_df[
-        excel_df["Player"].str.contains(player, na=False, case=False)
-    ]
-    if not player_data.empty:
-        row = player_data.iloc[0]
+    rows = name_index.get(SUFFIX_RE.sub("", player.lower().strip()))
+    if rows is None:
+        # Fall back to a substring scan for partial names
+        rows = np.flatnonzero(
+            excel_df["Player"].str.contains(player, na=False, case=False, regex=False)
+        )
+    if len(rows):
+        row = excel_df.iloc[rows[0]]
         print(
             f'{row["Player"]:<20} - ADP: {row["adp"]:<3} Priority: {row["Draft_Priority"]:.1f}'
         )
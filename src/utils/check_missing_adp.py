@@ -1,19 +1,25 @@
 import pandas as pd
 
-# Check column names in the Excel file
-excel_df = pd.read_excel(
-    "../output/dynasty_superflex_cheatsheet.xlsx", sheet_name="Overall"
-)
+CHEATSHEET = "../output/dynasty_superflex_cheatsheet.xlsx"
+
+# Check column names in the Excel file (header row only)
+columns = pd.read_excel(CHEATSHEET, sheet_name="Overall", nrows=0).columns
 
 print("Available columns:")
-for col in excel_df.columns:
+for col in columns:
     print(f"  {col}")
 
+# Only the columns the checks below use
+excel_df = pd.read_excel(
+    CHEATSHEET, sheet_name="Overall", usecols=["Player", "Points", "adp"]
+)
+
 print(f"\nTotal rows: {len(excel_df)}")
 
 # Check for players with ADP 999 (missing ADP)
 missing_adp = excel_df[excel_df["adp"] == 999]
 
 print(f"\nPlayers with missing ADP (total: {len(missing_adp)}):")
-for _, row in missing_adp.head(10).iterrows():
-    print(f'{row["Player"]:<25} - Points: {row["Points"]:.1f}')
+top_missing = missing_adp.head(10)
+for player, points in zip(top_missing["Player"], top_missing["Points"]):
+    print(f"{player:<25} - Points: {points:.1f}")
@@ -18,12 +18,12 @@ print(idp_df.head())
 print("\nChecking for other name variations...")
 
 # Look for players with apostrophes, periods, or other special characters
+# (suffixes III/IV/V; "IV" is covered by matching any "V")
 special_chars = []
 for df, name in [(adp_df, "ADP"), (offense_df, "Offense"), (idp_df, "IDP")]:
     if "Player" in df.columns:
-        for player in df["Player"].dropna():
-            if any(char in player for char in ["'", ".", "-", "III", "IV", "V"]):
-                special_chars.append((player, name))
+        mask = df["Player"].str.contains(r"['.\-V]|III", regex=True, na=False)
+        special_chars.extend((player, name) for player in df.loc[mask, "Player"])
 
 if special_chars:
     print("Players with special characters:")
@@ -1,3 +1,5 @@
+import re
+
 import pandas as pd
 
 # Check ADP status of players with special characters
@@ -18,14 +20,26 @@ special_char_players = [
     "De'Von Achane",
 ]
 
+# Match every name in one pass over the sheet: one named group per name, and
+# extractall so a row mentioning several names counts for each of them
+name_pattern = "|".join(
+    f"(?P<n{i}>{player})" for i, player in enumerate(special_char_players)
+)
+found = (
+    excel_df["Player"]
+    .astype(object)
+    .str.extractall(name_pattern, flags=re.IGNORECASE)
+    .notna()
+    .groupby(level=0)
+    .any()
+)
+
 print("ADP status for players with special characters:")
 print("=" * 60)
-for player in special_char_players:
-    player_data = excel_df[
-        excel_df["Player"].str.contains(player, na=False, case=False)
-    ]
-    if not player_data.empty:
-        row = player_data.iloc[0]
+for i, player in enumerate(special_char_players):
+    rows = found.index[found[f"n{i}"]] if f"n{i}" in found else []
+    if len(rows):
+        row = excel_df.loc[rows[0]]
         print(
             f'{row["Player"]:<25} - ADP: {row["adp"]:<3} Priority: {row["Draft_Priority"]:.1f}'
         )
@@ -1,5 +1,11 @@
 import re
 
+# Trailing generational suffix on a title-cased name ("Jr.", "Sr", "Ii", "Iv.", ...)
+_SUFFIX_RE = re.compile(r" +(?:Jr|Sr|Ii|Iii|Iv|V)\.?$")
+# Apostrophes, periods and hyphens, all dropped in one translate() pass
+_DROP_CHARS = str.maketrans("", "", "'.-")
+_SPACE_RE = re.compile(r"\s+")
+
 
 def normalize_player_name(name):
     """Normalize player names by removing common suffixes and standardizing format."""
@@ -10,44 +16,16 @@ def normalize_player_name(name):
     name = name.strip().title()
 
     # Remove common suffixes (Jr., Sr., II, III, etc.)
-    suffixes = [
-        " Jr.",
-        " Sr.",
-        " II",
-        " III",
-        " IV",
-        " V",
-        " Jr",
-        " Sr",
-        " Ii",
-        " Iii",
-        " Iv",
-        " V",
-        " Jr.",
-        " Sr.",
-        " Ii.",
-        " Iii.",
-        " Iv.",
-        " V.",
-    ]
-
-    for suffix in suffixes:
-        if name.endswith(suffix):
-            name = name[: -len(suffix)].strip()
-            break
+    name = _SUFFIX_RE.sub("", name)
 
     # Handle other common name variations
-    # Remove apostrophes (Ja'Marr -> JaMarr, De'Von -> DeVon)
-    name = name.replace("'", "")
-
-    # Remove periods (A.J. -> AJ, C.J. -> CJ)
-    name = name.replace(".", "")
-
-    # Standardize hyphens (Amon-Ra -> AmonRa, Jaxon Smith-Njigba -> Jaxon SmithNjigba)
-    name = name.replace("-", "")
+    # Remove apostrophes (Ja'Marr -> JaMarr, De'Von -> DeVon),
+    # periods (A.J. -> AJ, C.J. -> CJ) and
+    # hyphens (Amon-Ra -> AmonRa, Jaxon Smith-Njigba -> Jaxon SmithNjigba)
+    name = name.translate(_DROP_CHARS)
 
     # Remove extra spaces and normalize spacing
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _SPACE_RE.sub(" ", name).strip()
 
     return name
 
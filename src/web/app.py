@@ -24,7 +24,12 @@ from datetime import datetime, timedelta
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 # Import functions from the main tool for multi-source support
-from core.sleeper_cheatsheet import normalize_player_name, extract_position
+from core.sleeper_cheatsheet import (
+    consensus_column,
+    load_csv_absolute,
+    normalize_player_names,
+    PositionMapper,
+)
 
 app = Flask(__name__)
 CORS(app)
@@ -155,13 +160,6 @@ def update_cache_timestamp():
             data_cache["file_hashes"][filepath] = get_file_hash(filepath)
 
 
-def load_csv_absolute(path: str) -> pd.DataFrame:
-    """Load CSV without path resolution - assumes path is already absolute or correctly resolved."""
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Missing file: {path}")
-    return pd.read_csv(path)
-
-
 def standardize_offense_position_aware(df: pd.DataFrame) -> pd.DataFrame:
     """
     Position-aware column mapping for offense projections.
@@ -214,9 +212,7 @@ def standardize_offense_position_aware(df: pd.DataFrame) -> pd.DataFrame:
         df["team"] = ""
 
     # Clean and extract positions
-    df["position"] = df["position"].apply(
-        lambda x: extract_position(str(x)) if pd.notna(x) else ""
-    )
+    df["position"] = PositionMapper.extract_position_series(df["position"])
 
     # Initialize stat columns
     stat_cols = [
@@ -340,87 +336,41 @@ def load_consensus_projections(cfg: dict) -> pd.DataFrame:
 
     all_numeric_cols = list(all_numeric_cols)
 
-    # Create a master list of all players with their positions and teams
-    player_info = {}
-    for df in source_dfs:
-        for _, row in df.iterrows():
-            player = row["player"]
-            # Use normalized name for grouping to handle Jr/Sr variations
-            normalized_player = normalize_player_name(player)
-            if normalized_player not in player_info:
-                player_info[normalized_player] = {
-                    "original_names": [player],
-                    "position": row.get("position", ""),
-                    "team": row.get("team", ""),
-                }
-            else:
-                # Add to list of original names if not already present
-                if player not in player_info[normalized_player]["original_names"]:
-                    player_info[normalized_player]["original_names"].append(player)
-
-    # Create consensus projections for all players
-    consensus_rows = []
-
-    for normalized_player, info in player_info.items():
-        # Start with player identification - use the first original name
-        consensus_row = {
-            "player": info["original_names"][0],
-            "position": info["position"],
-            "team": info["team"],
-        }
-
-        # Find all data for this player across sources (using all original names)
-        player_data = []
-        for df in source_dfs:
-            for original_name in info["original_names"]:
-                player_rows = df[df["player"] == original_name]
-                if not player_rows.empty:
-                    player_data.append(player_rows.iloc[0])
-
-        # If we have data for this player from at least one source
-        if len(player_data) >= consensus_config.get("min_sources", 1):
-            # Calculate consensus values for each numeric column
-            for col in all_numeric_cols:
-                values = []
-                weights = []
-
-                for row in player_data:
-                    if col in row and not pd.isna(row[col]):
-                        values.append(row[col])
-                        weights.append(row["_weight"])
-
-                if values:
-                    # Calculate weighted average
-                    if len(values) == 1:
-                        consensus_row[col] = values[0]
-                    else:
-                        # Handle outlier detection if configured
-                        outlier_threshold = consensus_config.get(
-                            "outlier_threshold", None
-                        )
-                        if outlier_threshold and len(values) > 2:
-                            mean_val = np.mean(values)
-                            std_val = np.std(values)
-                            if std_val > 0:  # Avoid division by zero
-                                outlier_mask = (
-                                    np.abs(np.array(values) - mean_val)
-                                    <= outlier_threshold * std_val
-                                )
-                                values = np.array(values)[outlier_mask].tolist()
-                                weights = np.array(weights)[outlier_mask].tolist()
-
-                        if values and np.sum(weights) > 0:
-                            consensus_row[col] = np.average(values, weights=weights)
-                        else:
-                            consensus_row[col] = 0.0
-                else:
-                    # No data for this column, use 0
-                    consensus_row[col] = 0.0
-
-            consensus_rows.append(consensus_row)
+    # Stack every source, grouping rows by normalized name to catch Jr/Sr variations
+    stacked = pd.concat(source_dfs, ignore_index=True, sort=False)
+    stacked["_source_idx"] = np.repeat(
+        np.arange(len(source_dfs)), [len(df) for df in source_dfs]
+    )
+    stacked = stacked[stacked["player"].notna()]
+    normalized = normalize_player_names(stacked["player"])
+    group_codes, group_names = pd.factorize(normalized)
+
+    # Player identification comes from the first row seen for each player
+    consensus_df = stacked.loc[
+        ~normalized.duplicated().to_numpy(), ["player", "position", "team"]
+    ].reset_index(drop=True)
+
+    # Outlier trimming and weighted averages run one stat column at a time
+    # over every player, visiting rows in the same order as the core loader
+    stacked = stacked.assign(
+        _group=group_codes, _name=pd.factorize(stacked["player"])[0]
+    ).sort_values(["_group", "_source_idx", "_name"], kind="stable")
+    groups = stacked["_group"].to_numpy()
+    slot = stacked.groupby("_group", sort=False).cumcount().to_numpy()
+    weights = stacked["_weight"].to_numpy(dtype=float)
+    slots = [np.flatnonzero(slot == j) for j in range(slot.max(initial=-1) + 1)]
+
+    outlier_threshold = consensus_config.get("outlier_threshold", None)
+    for col in all_numeric_cols:
+        values = pd.to_numeric(stacked[col], errors="coerce").to_numpy(dtype=float)
+        consensus_df[col] = consensus_column(
+            values, weights, groups, slots, len(group_names), outlier_threshold
+        )
 
-    # Create final consensus DataFrame
-    consensus_df = pd.DataFrame(consensus_rows)
+    # Keep players with data from enough sources
+    source_rows = np.bincount(groups, minlength=len(group_names))
+    enough = source_rows >= consensus_config.get("min_sources", 1)
+    consensus_df = consensus_df[enough].reset_index(drop=True)
 
     return consensus_df
 
@@ -785,34 +735,35 @@ def process_data_for_web():
                 # Ensure ADP column is numeric
                 adp["adp"] = pd.to_numeric(adp["adp"], errors="coerce")
 
-                # Normalize player names for better matching
-                adp_copy = adp.copy()
-                projections_copy = projections.copy()
-                adp_copy["normalized_name"] = adp_copy["player"].apply(
-                    normalize_player_name
+                # Normalize player names and factorize them into shared integer
+                # codes so the join hashes ints rather than Python strings. The
+                # merge builds the new frame, so neither input needs a copy.
+                name_codes, _ = pd.factorize(
+                    pd.concat(
+                        [
+                            normalize_player_names(projections["player"]),
+                            normalize_player_names(adp["player"]),
+                        ],
+                        ignore_index=True,
+                    )
                 )
-                projections_copy["normalized_name"] = projections_copy["player"].apply(
-                    normalize_player_name
+                adp_codes = pd.DataFrame(
+                    {
+                        "name_code": name_codes[len(projections) :],
+                        "adp": adp["adp"].to_numpy(),
+                    }
                 )
 
                 # Merge on normalized names and update ADP
-                projections_copy = projections_copy.merge(
-                    adp_copy[["normalized_name", "adp"]],
-                    on="normalized_name",
-                    how="left",
-                )
+                projections = projections.assign(
+                    name_code=name_codes[: len(projections)]
+                ).merge(adp_codes, on="name_code", how="left")
 
                 # Update ADP column - use sleeper ADP if available, otherwise keep existing
-                projections_copy["adp"] = projections_copy["adp_y"].fillna(
-                    projections_copy["adp_x"]
-                )
+                projections["adp"] = projections["adp_y"].fillna(projections["adp_x"])
 
                 # Clean up - remove temporary columns
-                projections_copy = projections_copy.drop(
-                    columns=["normalized_name", "adp_x", "adp_y"]
-                )
-
-                projections = projections_copy
+                projections = projections.drop(columns=["name_code", "adp_x", "adp_y"])
             else:
                 # ADP already exists from multi-source, just ensure it's numeric
                 projections["adp"] = pd.to_numeric(
@@ -959,22 +910,16 @@ def process_data_for_web():
             # Keep these as lowercase to match JavaScript expectations
             # player, position, points, adp, team should stay lowercase
 
-            # Create position-specific dataframes
+            # Create position-specific dataframes from a single grouping pass
             by_pos = {}
+            position_groups = dict(tuple(projections.groupby("position", sort=False)))
             for pos in ["QB", "RB", "WR", "TE"]:
-                pos_df = projections[projections["position"] == pos].copy()
-                if not pos_df.empty:
-                    pos_df["pos_rank"] = range(1, len(pos_df) + 1)
-                    pos_df["drafted"] = False
-
-                    # Apply same column mapping for position data
-                    pos_df_for_frontend = pos_df.copy()
-                    for old_col, new_col in column_mapping.items():
-                        if old_col in pos_df_for_frontend.columns:
-                            pos_df_for_frontend = pos_df_for_frontend.rename(
-                                columns={old_col: new_col}
-                            )
-
+                pos_df = position_groups.get(pos)
+                if pos_df is not None and not pos_df.empty:
+                    # Apply same column mapping for position data (rename copies)
+                    pos_df_for_frontend = pos_df.rename(columns=column_mapping)
+                    pos_df_for_frontend["pos_rank"] = range(1, len(pos_df) + 1)
+                    pos_df_for_frontend["drafted"] = False
                     pos_df_for_frontend["Pos_Rank"] = range(
                         1, len(pos_df_for_frontend) + 1
                     )
@@ -0,0 +1,88 @@
+"""Tests for matching ADP onto the projection pool by normalized name."""
+
+from difflib import SequenceMatcher
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from core import sleeper_cheatsheet
+from core.sleeper_cheatsheet import DataProcessor, normalize_player_names
+
+
+def lookup(pool_players, adp_players, adp_values):
+    adp = pd.Series(adp_values, dtype=float)
+    return DataProcessor.lookup_adp(
+        normalize_player_names(pd.Series(pool_players, dtype=object)),
+        normalize_player_names(pd.Series(adp_players, dtype=object)),
+        adp,
+    )
+
+
+def test_duplicate_adp_names_take_the_earliest_adp():
+    result = lookup(
+        ["Josh Allen", "CeeDee Lamb", "Bijan Robinson"],
+        ["CeeDee Lamb", "Josh Allen", "CeeDee Lamb", "Bijan Robinson"],
+        [36.0, 3.0, 6.0, 1.0],
+    )
+
+    # One value per pool player, in pool order
+    assert result.tolist() == [3.0, 6.0, 1.0]
+
+
+def test_suffix_variants_share_one_adp_and_unmatched_is_nan():
+    result = lookup(
+        ["Marvin Harrison Jr.", "Unknown Rookie"],
+        ["Marvin Harrison", "Marvin Harrison Jr.", "Josh Allen"],
+        [14.0, 9.0, 3.0],
+    )
+
+    assert result.iloc[0] == 9.0
+    assert np.isnan(result.iloc[1])
+
+
+def test_keeps_pool_index():
+    pool_names = normalize_player_names(
+        pd.Series(["A.J. Brown", "Josh Allen"], index=[10, 20], dtype=object)
+    )
+    adp_names = normalize_player_names(pd.Series(["Josh Allen", "A.J. Brown"]))
+
+    result = DataProcessor.lookup_adp(pool_names, adp_names, pd.Series([3.0, 12.0]))
+
+    assert result.to_dict() == {10: 12.0, 20: 3.0}
+
+
+class _FakeProcess:
+    """Stand-in for rapidfuzz.process scoring with difflib."""
+
+    @staticmethod
+    def extractOne(name, choices, scorer=None, score_cutoff=0):
+        scored = [
+            (choice, SequenceMatcher(None, name, choice).ratio() * 100)
+            for choice in choices
+        ]
+        best = max(scored, key=lambda item: item[1], default=None)
+        return best if best is not None and best[1] >= score_cutoff else None
+
+
+def test_fuzzy_fill_skips_taken_names_and_takes_earliest_adp(monkeypatch):
+    monkeypatch.setattr(sleeper_cheatsheet, "fuzz", SimpleNamespace(WRatio=None))
+    monkeypatch.setattr(sleeper_cheatsheet, "fuzz_process", _FakeProcess)
+
+    pool = pd.DataFrame({"player": ["Josh Allen", "Josh Allan", "Cee Dee Lamb"]})
+    adp = pd.DataFrame(
+        {
+            "player": ["CeeDee Lamb", "Josh Allen", "CeeDee Lamb"],
+            "adp": [36.0, 3.0, 6.0],
+        }
+    )
+    pool_names = normalize_player_names(pool["player"])
+    adp_names = normalize_player_names(adp["player"])
+    pool["adp"] = DataProcessor.lookup_adp(pool_names, adp_names, adp["adp"])
+
+    filled = DataProcessor.fill_adp_fuzzy(pool, pool_names, adp, adp_names, 80)
+
+    # "Josh Allan" would fuzzy-match Josh Allen, who already has an exact match
+    assert filled.iloc[0] == 3.0
+    assert np.isnan(filled.iloc[1])
+    assert filled.iloc[2] == 6.0
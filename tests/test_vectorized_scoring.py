@@ -0,0 +1,205 @@
+"""Regression tests for the vectorized draft priority and consensus paths.
+
+Expected values were taken from the original row-by-row implementation.
+"""
+
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.sleeper_cheatsheet import DraftPriorityCalculator, load_consensus_projections
+
+ROOT = Path(__file__).resolve().parents[1]
+
+LEAGUE = {
+    "num_teams": 12,
+    "superflex": True,
+    "starters": {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "DL": 1, "LB": 1, "DB": 1},
+}
+
+
+@pytest.fixture
+def board():
+    """A small overall board with a points tie, missing ADP and a 999 ADP."""
+    df = pd.DataFrame(
+        {
+            "player": [
+                "Josh Allen",
+                "Bijan Robinson",
+                "Ja'Marr Chase",
+                "Brock Bowers",
+                "Tied Back",
+                "Late Receiver",
+                "Fred Warner",
+                "No Adp Guy",
+            ],
+            "position": ["QB", "RB", "WR", "TE", "RB", "WR", "LB", "QB"],
+            "Points": [380.0, 310.5, 300.0, 210.0, 310.5, 150.2, 180.0, 240.0],
+            "VORP": [120.0, 95.0, 90.0, 60.0, 95.0, 5.0, 40.0, 0.0],
+            "adp": [3.0, 1.0, 2.0, 20.0, 45.0, 140.0, np.nan, 999.0],
+        }
+    )
+    df["Rank"] = df["Points"].rank(ascending=False, method="first").astype(int)
+    df["ADP_Diff"] = df["Rank"] - df["adp"]
+    return df
+
+
+def test_draft_priority_default_strategy(board):
+    priority = DraftPriorityCalculator(LEAGUE).calculate_draft_priority(board)
+
+    assert priority.tolist() == [175.0, 140.2, 146.6, 91.3, 85.2, 7.3, 81.2, 18.5]
+
+
+def test_draft_priority_2025_strategy(board):
+    with open(ROOT / "config" / "draft_strategy.json") as f:
+        strategy = json.load(f)["draft_strategy_2025"]
+
+    priority = DraftPriorityCalculator(LEAGUE, strategy).calculate_draft_priority(board)
+
+    assert priority.tolist() == [175.0, 150.2, 146.6, 99.3, 95.2, 7.3, 81.2, 18.5]
+
+
+SOURCES = {
+    "alpha": (
+        "player,pos,team,YDS,TDS,REC\n"
+        "A.J. Brown,WR1,PHI,1200.0,9.0,80.0\n"
+        "Marvin Harrison Jr.,WR2,ARI,1000.0,7.0,70.0\n"
+        "Solo Back,RB3,KC,400.0,3.0,\n"
+        "Josh Allen,QB1,BUF,4100.0,30.0,\n",
+        1.0,
+    ),
+    "beta": (
+        "player,pos,team,YDS,TDS,REC\n"
+        "A.J. Brown,WR1,PHI,1100.0,8.0,76.0\n"
+        "Marvin Harrison,WR2,ARI,900.0,,64.0\n"
+        "Josh Allen,QB1,BUF,4300.0,32.0,\n",
+        0.5,
+    ),
+    "gamma": (
+        "player,pos,team,YDS,TDS,REC\n"
+        "A.J. Brown,WR1,PHI,1500.0,9.0,82.0\n"
+        "Josh Allen,QB1,BUF,4150.0,31.0,\n",
+        0.25,
+    ),
+}
+
+
+# Sparse coverage: players missing from some sources, and zero-weight sources
+SPARSE_SOURCES = {
+    "full": (
+        "player,pos,team,YDS,TDS,REC\n"
+        "Gap Guy,WR1,KC,1000.0,8.0,70.0\n"
+        "All Three,RB1,SF,800.0,6.0,40.0\n"
+        "Outvoted,WR3,NYJ,100.0,1.0,10.0\n",
+        1.0,
+    ),
+    "zero": (
+        "player,pos,team,YDS,TDS,REC\n"
+        "All Three,RB1,SF,2000.0,20.0,90.0\n"
+        "Zero Only,TE1,LV,600.0,4.0,50.0\n"
+        "Outvoted,WR3,NYJ,700.0,5.0,40.0\n",
+        0.0,
+    ),
+    "half": (
+        "player,pos,team,YDS,TDS,REC\n"
+        "All Three,RB1,SF,900.0,7.0,44.0\n"
+        "Gap Guy,WR1,KC,1200.0,10.0,80.0\n",
+        0.5,
+    ),
+    "nil": (
+        "player,pos,team,YDS,TDS,REC\nOutvoted,WR3,NYJ,710.0,5.0,41.0\n",
+        0.0,
+    ),
+}
+
+
+def consensus(tmp_path, outlier_threshold, source_specs=SOURCES):
+    sources = []
+    for name, (text, weight) in source_specs.items():
+        path = tmp_path / f"{name}.csv"
+        path.write_text(text)
+        sources.append({"name": name, "path": str(path), "weight": weight})
+
+    cfg = {
+        "paths": {"offense_sources": sources},
+        "consensus": {"outlier_threshold": outlier_threshold},
+    }
+    with redirect_stdout(io.StringIO()):
+        return load_consensus_projections(cfg).set_index("player")
+
+
+def test_consensus_weighted_average(tmp_path):
+    result = consensus(tmp_path, None)
+
+    # Jr. suffix variants merge into the first-seen name
+    assert result.index.tolist() == [
+        "A.J. Brown",
+        "Marvin Harrison Jr.",
+        "Solo Back",
+        "Josh Allen",
+    ]
+    assert result.loc["A.J. Brown", "rec_yards"] == pytest.approx(
+        (1200 * 1.0 + 1100 * 0.5 + 1500 * 0.25) / 1.75
+    )
+    assert result.loc["A.J. Brown", "receptions"] == pytest.approx(
+        (80 * 1.0 + 76 * 0.5 + 82 * 0.25) / 1.75
+    )
+    # A missing stat counts as zero in that source's row
+    assert result.loc["Marvin Harrison Jr.", "rec_td"] == pytest.approx(
+        (7 * 1.0 + 0 * 0.5) / 1.5
+    )
+    # A single-source player keeps its values as-is
+    assert result.loc["Solo Back", "rec_yards"] == 400.0
+    assert result.loc["Solo Back", "rec_td"] == 3.0
+    assert result.loc["Josh Allen", "pass_yards"] == pytest.approx(
+        (4100 * 1.0 + 4300 * 0.5 + 4150 * 0.25) / 1.75
+    )
+
+
+def test_consensus_drops_outliers(tmp_path):
+    result = consensus(tmp_path, 1.0)
+
+    # 1500 is more than one standard deviation from the three-source mean
+    assert result.loc["A.J. Brown", "rec_yards"] == pytest.approx(
+        (1200 * 1.0 + 1100 * 0.5) / 1.5
+    )
+    assert result.loc["Josh Allen", "pass_yards"] == pytest.approx(
+        (4100 * 1.0 + 4150 * 0.25) / 1.25
+    )
+    # Two sources are never trimmed
+    assert result.loc["Marvin Harrison Jr.", "rec_yards"] == pytest.approx(
+        (1000 * 1.0 + 900 * 0.5) / 1.5
+    )
+    assert result.loc["Solo Back", "rec_yards"] == 400.0
+
+
+def test_consensus_sparse_and_zero_weight_sources(tmp_path):
+    result = consensus(tmp_path, None, SPARSE_SOURCES)
+
+    # Only the sources that list a player count toward its average
+    assert result.loc["Gap Guy", "rec_yards"] == pytest.approx(
+        (1000 * 1.0 + 1200 * 0.5) / 1.5
+    )
+    # A zero-weight source contributes nothing to a shared player...
+    assert result.loc["All Three", "rec_yards"] == pytest.approx(
+        (800 * 1.0 + 2000 * 0.0 + 900 * 0.5) / 1.5
+    )
+    # ...but a player only it lists keeps that value as-is
+    assert result.loc["Zero Only", "rec_yards"] == 600.0
+    assert result.loc["Zero Only", "receptions"] == 50.0
+
+
+def test_consensus_trimmed_to_zero_weight_values(tmp_path):
+    result = consensus(tmp_path, 1.0, SPARSE_SOURCES)
+
+    # 100 is dropped as an outlier, leaving only zero-weight values
+    assert result.loc["Outvoted", "rec_yards"] == 0.0
+    assert result.loc["All Three", "rec_yards"] == pytest.approx(
+        (800 * 1.0 + 900 * 0.5) / 1.5
+    )
+    assert result.loc["Zero Only", "rec_yards"] == 600.0